@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Context Tools
+
+Single entry point for the context version control, validation and
+maintenance commands. Equivalent to `python -m context_tools`.
+"""
+
+import sys
+
+from context_tools.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
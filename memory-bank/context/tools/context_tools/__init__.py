@@ -0,0 +1,35 @@
+"""
+Context Tools
+
+Version control, validation and maintenance tools for the memory-bank
+context files. Submodules are loaded on first use, so importing the package
+or a single tool does not pull in the others.
+"""
+
+import importlib
+
+
+_EXPORTS = {
+    "ContextVersionManager": "version_manager",
+    "BumpConflictError": "version_manager",
+    "ContextValidator": "validator",
+    "RevisionValidator": "validator",
+    "PipelineValidator": "pipeline",
+    "HistoryStore": "history_store",
+    "HistoryChecker": "history_check",
+    "FrontmatterDocument": "frontmatter_editor",
+    "FrontmatterSchema": "frontmatter_schema",
+    "DuplicateFinder": "duplicates",
+    "MetricsStore": "metrics_store",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
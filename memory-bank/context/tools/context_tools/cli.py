@@ -0,0 +1,365 @@
+"""
+Context Tools Command Line
+
+Single multiplexed entry point for every context tool command. Each command
+imports only the modules it needs, and options are parsed by a small
+table-driven parser instead of argparse, so read-only commands such as
+`status` and `list` start without loading YAML, argparse or hashlib. Keep
+imports at the top of this module to the standard library's cheapest
+modules; the startup budget is enforced by the `startup-check` command.
+
+The legacy `context-version.py`, `context-validator.py` and
+`fix-checksums.py` scripts call `main` with their own subset of commands,
+listed in `TOOLS`.
+"""
+
+import sys
+from typing import Callable, Dict, List, Optional
+
+
+class UsageError(Exception):
+    """Raised for invalid command lines."""
+
+
+class Option:
+    """One command line option."""
+
+    __slots__ = ("names", "dest", "kind", "type", "default", "choices", "help")
+
+    def __init__(self, names: str, dest: str, kind: str = "value", type: Callable = str,
+                 default=None, choices: Optional[List[str]] = None, help: str = ""):
+        self.names = names.split(",")
+        self.dest = dest
+        self.kind = kind  # "value", "flag" or "append"
+        self.type = type
+        self.default = default
+        self.choices = choices
+        self.help = help
+
+
+CONTEXT_ROOT = Option("--context-root", "context_root", default="memory-bank",
+                      help="Context root directory")
+FILE = Option("--file,-f", "file", help="Target file path")
+
+
+class Command:
+    """A command name, its handler and the options it accepts."""
+
+    __slots__ = ("name", "handler", "options", "help")
+
+    def __init__(self, name: str, handler: Callable[[Dict], int], options: List[Option], help: str):
+        self.name = name
+        self.handler = handler
+        self.options = options + [CONTEXT_ROOT]
+        self.help = help
+
+
+def parse_options(argv: List[str], options: List[Option]) -> Dict:
+    """Parse argv against options, returning {dest: value}."""
+    by_name = {name: option for option in options for name in option.names}
+    values = {option.dest: ([] if option.kind == "append" else
+                            False if option.kind == "flag" else option.default)
+              for option in options}
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        name, has_inline, inline = arg.partition("=") if arg.startswith("--") else (arg, False, "")
+        option = by_name.get(name)
+        if option is None:
+            raise UsageError(f"unrecognized argument: {arg}")
+
+        if option.kind == "flag":
+            if has_inline:
+                raise UsageError(f"{name} does not take a value")
+            values[option.dest] = True
+            i += 1
+            continue
+
+        if has_inline:
+            raw = inline
+            i += 1
+        elif i + 1 < len(argv):
+            raw = argv[i + 1]
+            i += 2
+        else:
+            raise UsageError(f"{name} expects a value")
+
+        try:
+            value = option.type(raw)
+        except ValueError:
+            raise UsageError(f"invalid value for {name}: {raw!r}")
+        if option.choices and value not in option.choices:
+            raise UsageError(f"invalid choice for {name}: {raw!r} "
+                             f"(choose from {', '.join(option.choices)})")
+
+        if option.kind == "append":
+            values[option.dest].append(value)
+        else:
+            values[option.dest] = value
+
+    return values
+
+
+# ----------------------------------------------------------------------
+# Command handlers. Each imports what it needs when it runs.
+# ----------------------------------------------------------------------
+
+def _version_manager(opts: Dict):
+    from .version_manager import ContextVersionManager
+    return ContextVersionManager(opts["context_root"])
+
+
+def _bump(opts: Dict) -> int:
+    if not opts["file"] or not opts["type"] or not opts["change_log"]:
+        print("Error: bump command requires --file, --type, and --change-log")
+        return 1
+    success = _version_manager(opts).bump_file_version(
+        opts["file"], opts["type"], opts["change_log"],
+        expected_checksum=opts["expected_checksum"], rebase=opts["rebase"],
+        retries=opts["retries"], lock_timeout=opts["lock_timeout"]
+    )
+    return 0 if success else 1
+
+
+def _status(opts: Dict) -> int:
+    if not opts["file"]:
+        print("Error: status command requires --file")
+        return 1
+    return 0 if _version_manager(opts).show_file_status(opts["file"]) else 1
+
+
+def _list(opts: Dict) -> int:
+    versioned_files = _version_manager(opts).list_versioned_files()
+    if versioned_files:
+        print("Versioned context files:")
+        for file_path in versioned_files:
+            print(f"  {file_path}")
+    else:
+        print("No versioned context files found")
+    return 0
+
+
+def _history(opts: Dict) -> int:
+    if not opts["file"]:
+        print("Error: history command requires --file")
+        return 1
+    success = _version_manager(opts).show_file_history(opts["file"], opts["target_version"])
+    return 0 if success else 1
+
+
+def _compact(opts: Dict) -> int:
+    success = _version_manager(opts).compact_history(opts["keep"], opts["prune"], opts["dry_run"],
+                                                     opts["lock_timeout"])
+    return 0 if success else 1
+
+
+def _history_check(opts: Dict) -> int:
+    from .history_check import check_history
+    return 0 if check_history(opts["context_root"], opts["backfill"]) else 1
+
+
+def _validate(opts: Dict) -> int:
+    from .validator import ContextValidator, validate_revisions
+    if opts["rev"]:
+        if opts["pipeline"]:
+            print("Error: --pipeline validates the working tree and cannot be combined with --rev")
+            return 1
+        return 0 if validate_revisions(opts["context_root"], opts["rev"]) else 1
+    if opts["pipeline"]:
+        from .pipeline import PipelineValidator
+        try:
+            validator = PipelineValidator(opts["context_root"], opts["concurrency"],
+                                          opts["queue_depth"])
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+    else:
+        validator = ContextValidator(opts["context_root"])
+    
+    validator.record_digests = not opts["no_metrics"]
+    import time
+    start = time.perf_counter()
+    valid = validator.validate_all_files()
+    if not opts["no_metrics"]:
+        from .metrics_store import record_validation
+        record_validation(opts["context_root"], validator,
+                          "pipeline" if opts["pipeline"] else "serial",
+                          time.perf_counter() - start)
+    return 0 if valid else 1
+
+
+def _trends(opts: Dict) -> int:
+    from .metrics_store import show_trends
+    success = show_trends(opts["context_root"], opts["runs"], opts["limit"],
+                          opts["recent"], opts["threshold"], opts["mode"])
+    return 0 if success else 1
+
+
+def _validate_file(opts: Dict) -> int:
+    from .validator import ContextValidator
+    if not opts["file"]:
+        print("Error: validate-file command requires --file")
+        return 1
+    return 0 if ContextValidator(opts["context_root"]).validate_single_file(opts["file"]) else 1
+
+
+def _dupes(opts: Dict) -> int:
+    from .validator import ContextValidator
+    return 0 if ContextValidator(opts["context_root"]).find_duplicates(opts["threshold"]) else 1
+
+
+def _fix_checksums(opts: Dict) -> int:
+    from .fix_checksums import fix_all_checksums
+    fix_all_checksums(opts["context_root"])
+    return 0
+
+
+def _startup_check(opts: Dict) -> int:
+    from .startup_budget import check_startup_budget
+    return 0 if check_startup_budget(opts["context_root"], opts["budget_ms"], opts["runs"]) else 1
+
+
+COMMANDS: Dict[str, Command] = {command.name: command for command in [
+    Command("bump", _bump, [
+        FILE,
+        Option("--type,-t", "type", choices=["patch", "minor", "major", "pre-release"],
+               help="Version bump type"),
+        Option("--change-log,-c", "change_log", help="Change log description"),
+        Option("--expected-checksum", "expected_checksum",
+               help="Fail the bump if the body checksum is no longer this value"),
+        Option("--rebase", "rebase", kind="flag",
+               help="On a checksum conflict, retry the bump on top of the new body"),
+        Option("--retries", "retries", type=int, default=3,
+               help="Maximum rebase attempts for --rebase"),
+        Option("--lock-timeout", "lock_timeout", type=float, default=10.0,
+               help="Seconds to wait for the per-file lock"),
+    ], "Bump the version of a context file"),
+    Command("status", _status, [FILE], "Show version metadata of a file"),
+    Command("list", _list, [], "List versioned context files"),
+    Command("history", _history, [
+        FILE,
+        Option("--version,-v", "target_version", help="Historical version to print"),
+    ], "List or print version history of a file"),
+    Command("compact", _compact, [
+        Option("--keep", "keep", type=int, default=5, help="Loose versions to keep per file"),
+        Option("--prune", "prune", kind="flag",
+               help="Delete versions beyond --keep instead of packing them"),
+        Option("--dry-run", "dry_run", kind="flag",
+               help="Report what compact would do without changing files"),
+        Option("--lock-timeout", "lock_timeout", type=float, default=10.0,
+               help="Seconds to wait for another compaction to finish"),
+    ], "Pack or prune old version history"),
+    Command("history-check", _history_check, [
+        Option("--backfill", "backfill", kind="flag",
+               help="Write every missing history entry in one batch"),
+    ], "Cross-check live files against the versions tree"),
+    Command("validate", _validate, [
+        Option("--rev", "rev", kind="append",
+               help="Validate a git revision from the object store (repeatable)"),
+        Option("--pipeline", "pipeline", kind="flag",
+               help="Overlap reads and stats with parsing and hashing (for network filesystems)"),
+        Option("--concurrency", "concurrency", type=int, default=16,
+               help="Maximum I/O operations in flight with --pipeline"),
+        Option("--queue-depth", "queue_depth", type=int, default=64,
+               help="Maximum files read ahead of validation with --pipeline"),
+        Option("--no-metrics", "no_metrics", kind="flag",
+               help="Do not record this run in the validation metrics store"),
+    ], "Validate all context files"),
+    Command("validate-file", _validate_file, [
+        Option("--file,-f", "file", help="Target file path for single file validation"),
+    ], "Validate a single context file"),
+    Command("trends", _trends, [
+        Option("--runs", "runs", type=int, default=30, help="Number of recent runs to analyse"),
+        Option("--limit", "limit", type=int, default=5, help="Rows per report section"),
+        Option("--recent", "recent", type=int, default=5,
+               help="Runs compared against the earlier ones for phase regressions"),
+        Option("--threshold", "threshold", type=float, default=1.5,
+               help="Slowdown factor that counts as a phase regression"),
+        Option("--mode", "mode", choices=["serial", "pipeline"],
+               help="Validation mode to report on (default: mode of the latest run)"),
+    ], "Report validation trends from recorded runs"),
+    Command("dupes", _dupes, [
+        Option("--threshold", "threshold", type=float, default=0.8,
+               help="Minimum estimated similarity for near duplicates"),
+    ], "Report duplicate and near-duplicate content"),
+    Command("fix-checksums", _fix_checksums, [], "Replace placeholder checksums"),
+    Command("startup-check", _startup_check, [
+        Option("--budget-ms", "budget_ms", type=float, default=60.0,
+               help="Maximum import time for read-only commands, in milliseconds"),
+        Option("--runs", "runs", type=int, default=3,
+               help="Measurements per command; the best is kept"),
+    ], "Check read-only command startup against the import time budget"),
+]}
+
+TOOLS: Dict[str, List[str]] = {
+    "context-tools": list(COMMANDS),
+    "context-version": ["bump", "status", "list", "history", "compact", "history-check"],
+    "context-validator": ["validate", "validate-file", "trends", "dupes"],
+    "fix-checksums": ["fix-checksums"],
+}
+
+
+def find_command(argv: List[str]) -> Optional[int]:
+    """Return the index of the first positional argument, skipping option values."""
+    takes_value = {
+        name
+        for command in COMMANDS.values()
+        for option in command.options if option.kind != "flag"
+        for name in option.names
+    }
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if not arg.startswith("-"):
+            return i
+        i += 2 if arg in takes_value else 1
+    return None
+
+
+def print_usage(prog: str, commands: List[str], command: Optional[str] = None, file=None) -> None:
+    file = file or sys.stdout
+    if command:
+        print(f"usage: {prog} {command} [options]\n\n{COMMANDS[command].help}\n\noptions:",
+              file=file)
+        for option in COMMANDS[command].options:
+            metavar = "" if option.kind == "flag" else f" {option.dest.upper()}"
+            print(f"  {', '.join(option.names)}{metavar}", file=file)
+            if option.help:
+                print(f"      {option.help}", file=file)
+        return
+
+    print(f"usage: {prog} {{{','.join(commands)}}} [options]\n\ncommands:", file=file)
+    for name in commands:
+        print(f"  {name:<15} {COMMANDS[name].help}", file=file)
+
+
+def main(argv: Optional[List[str]] = None, prog: str = "context-tools") -> int:
+    """Dispatch argv to a command handler and return its exit code."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    commands = TOOLS.get(prog, list(COMMANDS))
+
+    if not argv or argv[0] in ("-h", "--help"):
+        print_usage(prog, commands)
+        return 0 if argv else 2
+
+    # Like the original argparse interface, the command may appear after options
+    position = find_command(argv)
+    if position is None or argv[position] not in commands:
+        print_usage(prog, commands, file=sys.stderr)
+        print(f"{prog}: error: expected one of: {', '.join(commands)}", file=sys.stderr)
+        return 2
+    command = argv.pop(position)
+
+    if "-h" in argv or "--help" in argv:
+        print_usage(prog, commands, command)
+        return 0
+
+    try:
+        opts = parse_options(argv, COMMANDS[command].options)
+    except UsageError as e:
+        print(f"usage: {prog} {command} [options]", file=sys.stderr)
+        print(f"{prog}: error: {e}", file=sys.stderr)
+        return 2
+
+    return COMMANDS[command].handler(opts)
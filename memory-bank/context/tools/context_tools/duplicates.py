@@ -0,0 +1,263 @@
+"""
+Duplicate Content Detection
+
+This module finds exact and near-duplicate documents across the memory bank.
+
+- Exact duplicates share a body checksum (the same `sha256:` value stored in
+  frontmatter and checked by the validator).
+- Near duplicates are found with MinHash signatures over word shingles and
+  locality-sensitive hashing (LSH) banding, so candidate pairs come from
+  shared buckets instead of comparing every pair of documents.
+
+Signatures depend only on the body, so they are cached per checksum and only
+new or changed bodies are hashed on later runs. The cache is a header line
+followed by fixed-width binary records (the 32-byte body digest, then one
+8-byte value per permutation). New signatures are appended; when a run no
+longer sees some checksums the file is rewritten without them.
+"""
+
+import hashlib
+import os
+import re
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .frontmatter_editor import body_checksum
+
+
+MERSENNE_PRIME = (1 << 61) - 1
+WORD_PATTERN = re.compile(r'\w+')
+CACHE_MAGIC = "CTXMINHASH2"
+CHECKSUM_PREFIX = "sha256:"
+DIGEST_SIZE = 32
+
+
+def shingles(text: str, size: int) -> set:
+    """Return the set of hashed word shingles of text."""
+    words = WORD_PATTERN.findall(text.lower())
+    if not words:
+        return set()
+    if len(words) < size:
+        grams = [" ".join(words)]
+    else:
+        grams = (" ".join(words[i:i + size]) for i in range(len(words) - size + 1))
+    return {
+        int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), "little")
+        for gram in grams
+    }
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Pick (bands, rows) so the LSH S-curve crosses 50% near threshold."""
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class SignatureCache:
+    """Cache of MinHash signatures keyed by body checksum, in fixed-width records."""
+
+    def __init__(self, cache_path: Path, params: str, num_perm: int):
+        self.cache_path = Path(cache_path)
+        self.header = f"{CACHE_MAGIC}\t{params}\n".encode('utf-8')
+        self.record_size = DIGEST_SIZE + num_perm * 8
+        self.signatures: Dict[str, array] = {}
+        self._seen: Set[str] = set()
+        self._pending: List[Tuple[str, array]] = []
+        self._rewrite = True
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = self.cache_path.read_bytes()
+        except FileNotFoundError:
+            return
+        # Signatures from other parameters are useless; start over
+        if not data.startswith(self.header):
+            return
+        body = memoryview(data)[len(self.header):]
+        usable = len(body) - len(body) % self.record_size
+        for offset in range(0, usable, self.record_size):
+            record = body[offset:offset + self.record_size]
+            signature = array("Q")
+            signature.frombytes(record[DIGEST_SIZE:])
+            self.signatures[CHECKSUM_PREFIX + record[:DIGEST_SIZE].hex()] = signature
+        # A partial trailing record is left by an interrupted append
+        self._rewrite = usable != len(body)
+
+    @staticmethod
+    def _digest(checksum: str) -> Optional[bytes]:
+        if not checksum.startswith(CHECKSUM_PREFIX):
+            return None
+        try:
+            digest = bytes.fromhex(checksum[len(CHECKSUM_PREFIX):])
+        except ValueError:
+            return None
+        return digest if len(digest) == DIGEST_SIZE else None
+
+    def get(self, checksum: str) -> Optional[array]:
+        self._seen.add(checksum)
+        return self.signatures.get(checksum)
+
+    def put(self, checksum: str, signature: array) -> None:
+        self._seen.add(checksum)
+        if self._digest(checksum) is None:
+            return
+        self.signatures[checksum] = signature
+        self._pending.append((checksum, signature))
+
+    def _records(self, entries: Iterable[Tuple[str, array]]) -> Iterable[bytes]:
+        for checksum, signature in entries:
+            yield self._digest(checksum) + signature.tobytes()
+
+    def flush(self) -> None:
+        """Append new signatures, or rewrite the file without checksums not seen this run."""
+        stale = [checksum for checksum in self.signatures if checksum not in self._seen]
+        for checksum in stale:
+            del self.signatures[checksum]
+
+        if stale or self._rewrite:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(self.header)
+                for record in self._records(self.signatures.items()):
+                    f.write(record)
+            os.replace(tmp_path, self.cache_path)
+        elif self._pending:
+            with open(self.cache_path, "ab") as f:
+                for record in self._records(self._pending):
+                    f.write(record)
+
+        self._rewrite = False
+        self._pending = []
+
+
+class DuplicateFinder:
+    """Groups documents into exact and near-duplicate clusters."""
+
+    def __init__(self, cache_path: Optional[Path] = None, threshold: float = 0.8,
+                 num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+
+        # Deterministic permutation parameters, derived from the seed
+        self._perms = []
+        for i in range(num_perm):
+            digest = hashlib.sha256(f"{seed}:{i}".encode('ascii')).digest()
+            a = int.from_bytes(digest[:8], "little") % (MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:16], "little") % MERSENNE_PRIME
+            self._perms.append((a, b))
+
+        params = f"perm={num_perm};shingle={shingle_size};seed={seed}"
+        self.cache = SignatureCache(cache_path, params, num_perm) if cache_path else None
+        self.hashed = 0
+
+    def signature(self, checksum: str, body: str) -> Optional[array]:
+        """Return the MinHash signature of a body, using the cache when possible."""
+        if self.cache is not None:
+            cached = self.cache.get(checksum)
+            if cached is not None:
+                return cached
+
+        hashes = shingles(body, self.shingle_size)
+        if not hashes:
+            return None
+
+        signature = array("Q", (
+            min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in self._perms
+        ))
+        self.hashed += 1
+        if self.cache is not None:
+            self.cache.put(checksum, signature)
+        return signature
+
+    def similarity(self, first: array, second: array) -> float:
+        """Estimate Jaccard similarity from two signatures."""
+        return sum(1 for x, y in zip(first, second) if x == y) / self.num_perm
+
+    def find(self, documents: Iterable[Tuple[str, str]]) -> Dict[str, List]:
+        """Cluster (name, body) documents.
+
+        Returns {"exact": [(checksum, [names])], "near": [[(name, similarity)]]}.
+        Near-duplicate clusters work on one representative per checksum, so
+        exact copies never inflate LSH buckets; similarity is measured
+        against the first member of each cluster.
+        """
+        by_checksum: Dict[str, List[str]] = {}
+        signatures: Dict[str, array] = {}
+
+        # Stream documents: bodies are hashed on first sight and then dropped
+        for name, body in documents:
+            checksum = body_checksum(body)
+            if checksum not in by_checksum:
+                by_checksum[checksum] = []
+                signature = self.signature(checksum, body)
+                if signature is not None:
+                    signatures[checksum] = signature
+            by_checksum[checksum].append(name)
+        if self.cache is not None:
+            self.cache.flush()
+
+        exact = sorted(
+            ((checksum, sorted(names)) for checksum, names in by_checksum.items() if len(names) > 1),
+            key=lambda item: (-len(item[1]), item[1][0])
+        )
+
+        # LSH banding: documents sharing any band become candidates
+        buckets: Dict[Tuple[int, bytes], List[str]] = {}
+        for checksum, signature in signatures.items():
+            for band in range(self.bands):
+                start = band * self.rows
+                key = (band, signature[start:start + self.rows].tobytes())
+                buckets.setdefault(key, []).append(checksum)
+
+        parent = {checksum: checksum for checksum in signatures}
+
+        def root(checksum: str) -> str:
+            while parent[checksum] != checksum:
+                parent[checksum] = parent[parent[checksum]]
+                checksum = parent[checksum]
+            return checksum
+
+        # Each bucket member is compared with the bucket's first member only, so
+        # the work grows linearly with bucket size rather than with its pairs
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            anchor = members[0]
+            for other in members[1:]:
+                if root(anchor) == root(other):
+                    continue
+                if self.similarity(signatures[anchor], signatures[other]) >= self.threshold:
+                    parent[root(other)] = root(anchor)
+
+        groups: Dict[str, List[str]] = {}
+        for checksum in signatures:
+            groups.setdefault(root(checksum), []).append(checksum)
+
+        near = []
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            members.sort(key=lambda checksum: by_checksum[checksum][0])
+            anchor = signatures[members[0]]
+            cluster = [
+                (name, self.similarity(anchor, signatures[checksum]))
+                for checksum in members
+                for name in sorted(by_checksum[checksum])
+            ]
+            near.append(cluster)
+        near.sort(key=lambda cluster: (-len(cluster), cluster[0][0]))
+
+        return {"exact": exact, "near": near}
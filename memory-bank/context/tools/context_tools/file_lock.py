@@ -0,0 +1,87 @@
+"""
+Per-File Advisory Locks
+
+This module provides the advisory locks used to serialise read-modify-write
+cycles on individual context files. Each context file gets its own lock file
+under `<context_root>/.locks/`, so agents working on disjoint files never
+wait on each other while agents touching the same file are serialised.
+
+On POSIX systems the lock is an `fcntl.flock` on the lock file, which the
+kernel releases automatically if the holder dies. Elsewhere the lock falls
+back to exclusive creation of the lock file.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+LOCK_DIR_NAME = ".locks"
+
+
+class LockTimeoutError(Exception):
+    """Raised when a file lock cannot be acquired within the timeout."""
+
+
+def lock_path_for(context_root: Path, file_path: Path) -> Path:
+    """Return the lock file path guarding file_path."""
+    context_root = Path(context_root).resolve()
+    try:
+        rel_path = Path(file_path).resolve().relative_to(context_root)
+    except ValueError:
+        rel_path = Path(Path(file_path).resolve().as_posix().lstrip("/"))
+    return context_root / LOCK_DIR_NAME / (rel_path.as_posix().replace("/", "__") + ".lock")
+
+
+@contextmanager
+def file_lock(context_root: Path, file_path: Path, timeout: float = 10.0,
+              poll_interval: float = 0.05) -> Iterator[Path]:
+    """Hold an exclusive advisory lock on file_path for the duration of the block."""
+    lock_path = lock_path_for(context_root, file_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+
+    if fcntl is not None:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise LockTimeoutError(
+                            f"Timed out after {timeout}s waiting for lock on {file_path}"
+                        )
+                    time.sleep(poll_interval)
+            try:
+                yield lock_path
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+        return
+
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644)
+            break
+        except FileExistsError:
+            if time.monotonic() >= deadline:
+                raise LockTimeoutError(
+                    f"Timed out after {timeout}s waiting for lock on {file_path}"
+                )
+            time.sleep(poll_interval)
+    try:
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        yield lock_path
+    finally:
+        os.close(fd)
+        os.unlink(lock_path)
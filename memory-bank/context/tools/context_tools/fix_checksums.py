@@ -0,0 +1,75 @@
+"""
+Fix Checksums
+
+This module updates all placeholder checksums in context files with actual calculated checksums.
+"""
+
+from pathlib import Path
+
+from .frontmatter_editor import FrontmatterDocument, FrontmatterError
+
+
+def fix_file_checksum(file_path: Path) -> bool:
+    """Fix checksum in a single file."""
+    try:
+        content = file_path.read_text(encoding='utf-8')
+        try:
+            document = FrontmatterDocument.parse(content)
+        except FrontmatterError as e:
+            print(f"Skipping {file_path}: {e}")
+            return False
+        frontmatter = document.data
+        
+        if not frontmatter or "checksum" not in frontmatter:
+            print(f"Skipping {file_path}: No checksum field")
+            return False
+        
+        # Check if checksum is placeholder
+        current_checksum = frontmatter.get("checksum", "")
+        if "initial_checksum_placeholder" not in current_checksum:
+            print(f"Skipping {file_path}: Checksum already set")
+            return False
+        
+        # Calculate new checksum and patch it into the header in place
+        new_checksum = document.body_checksum()
+        document.set("checksum", new_checksum)
+        new_content = document.render()
+        
+        # Write updated file
+        file_path.write_text(new_content, encoding='utf-8')
+        
+        print(f"Updated {file_path} with checksum: {new_checksum}")
+        return True
+        
+    except Exception as e:
+        print(f"Error updating {file_path}: {e}")
+        return False
+
+
+def fix_all_checksums(context_root: str = "memory-bank") -> int:
+    """Fix placeholder checksums in the known context files; return how many changed."""
+    context_root = Path(context_root)
+    
+    # Files to process
+    files_to_process = [
+        context_root / "context" / "entrypoint.md",
+        context_root / "rules" / "external-context-management.md",
+        context_root / "rules" / "task-file-usage.mdc",
+        context_root / "rules" / "terminal-safety.md",
+        context_root / "rules" / "multi-agent-locking-workflow.md",
+        context_root / "rules" / "conventional-commits-no-scope.md",
+        context_root / "rules" / "context-entrypoint.mdc",
+        context_root / "gemini" / "GEMINI.md"
+    ]
+    
+    updated_count = 0
+    
+    for file_path in files_to_process:
+        if file_path.exists():
+            if fix_file_checksum(file_path):
+                updated_count += 1
+        else:
+            print(f"File not found: {file_path}")
+    
+    print(f"\nUpdated {updated_count} files with new checksums")
+    return updated_count
@@ -0,0 +1,292 @@
+"""
+Round-Trip Frontmatter Editor
+
+This module edits YAML frontmatter in place. Parsing records the span of
+every top-level key's value in the original text; writing patches only the
+values that changed and leaves everything else byte for byte as it was:
+key order, comments, spacing, untouched values and the whole body.
+
+Because the body is never rewritten, its checksum can be computed once from
+the original text and stays valid after the header is patched.
+
+`read_header` is the fast path for read-only commands: it reads a file only
+up to the closing `---` and parses simple `key: value` lines without
+importing YAML, falling back to the YAML parser for anything else.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+KEY_PATTERN = re.compile(r'^([A-Za-z_][\w-]*)[ \t]*:')
+
+# Plain scalars that YAML 1.1 would not read as strings. Matching values
+# are handed to the YAML parser rather than guessed at.
+SIMPLE_LINE = re.compile(r'^([A-Za-z_][\w-]*):(?:[ \t]+(.*?))?[ \t]*$')
+DECIMAL_INT = re.compile(r'^[-+]?(?:0|[1-9][0-9]*)$')
+IMPLICIT_NON_STRING = re.compile(
+    r'^(?:[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])*\.[0-9_]*(?:[eE][-+][0-9]+)?'
+    r'|\.[0-9_]+(?:[eE][-+][0-9]+)?|[-+]?\.(?:inf|Inf|INF)|\.(?:nan|NaN|NAN)'
+    r'|[-+]?0b[0-1_]+|[-+]?0[0-7_]+|[-+]?(?:0|[1-9][0-9_]*)|[-+]?0x[0-9a-fA-F_]+'
+    r'|[-+]?[1-9][0-9_]*(?::[0-5]?[0-9])+'
+    r'|[0-9]{4}-[0-9]{2}-[0-9]{2}'
+    r'|[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}(?:[Tt]|[ \t]+)[0-9]{1,2}:[0-9]{2}:[0-9]{2}.*'
+    r'|<<|=)$'
+)
+BOOLEANS = {
+    "yes": True, "Yes": True, "YES": True, "true": True, "True": True, "TRUE": True,
+    "on": True, "On": True, "ON": True,
+    "no": False, "No": False, "NO": False, "false": False, "False": False, "FALSE": False,
+    "off": False, "Off": False, "OFF": False,
+}
+NULLS = {"", "~", "null", "Null", "NULL"}
+PLAIN_INDICATORS = set("-?:,[]{}#&*!|>'\"%@`")
+
+_NOT_SIMPLE = object()
+
+
+class FrontmatterError(Exception):
+    """Raised when a document has no well-formed frontmatter block."""
+
+
+def body_checksum(body: str) -> str:
+    """Calculate the SHA256 checksum of a body, ignoring surrounding whitespace."""
+    import hashlib
+    return f"sha256:{hashlib.sha256(body.strip().encode('utf-8')).hexdigest()}"
+
+
+def _quoted(text: str) -> Any:
+    """Return the string inside simple quotes, or _NOT_SIMPLE."""
+    if len(text) < 2 or text[0] != text[-1]:
+        return _NOT_SIMPLE
+    inner = text[1:-1]
+    if text[0] == '"':
+        return inner if '"' not in inner and "\\" not in inner else _NOT_SIMPLE
+    if text[0] == "'":
+        return inner.replace("''", "'") if "'" not in inner.replace("''", "") else _NOT_SIMPLE
+    return _NOT_SIMPLE
+
+
+def _simple_value(text: str) -> Any:
+    """Parse a single-line value without YAML, or return _NOT_SIMPLE."""
+    if text in NULLS:
+        return None
+    if text in BOOLEANS:
+        return BOOLEANS[text]
+    if DECIMAL_INT.match(text):
+        return int(text)
+    if text[0] in "'\"":
+        return _quoted(text)
+    if text[0] == "[":
+        if text[-1] != "]":
+            return _NOT_SIMPLE
+        inner = text[1:-1].strip()
+        if not inner:
+            return []
+        items = [_quoted(item.strip()) for item in inner.split(",")]
+        return _NOT_SIMPLE if _NOT_SIMPLE in items else items
+    if (text[0] in PLAIN_INDICATORS or ": " in text or " #" in text or "\t" in text
+            or text.endswith(":") or IMPLICIT_NON_STRING.match(text)):
+        return _NOT_SIMPLE
+    return text
+
+
+def parse_header(lines: List[str]) -> Dict:
+    """Parse frontmatter lines, using YAML only when a line is not simple."""
+    data: Dict[str, Any] = {}
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        match = SIMPLE_LINE.match(line.rstrip("\r\n"))
+        value = _simple_value(match.group(2) or "") if match else _NOT_SIMPLE
+        if value is _NOT_SIMPLE or match.group(1) in data:
+            return _yaml_header(lines)
+        data[match.group(1)] = value
+    return data
+
+
+def _yaml_header(lines: List[str]) -> Dict:
+    import yaml
+    try:
+        data = yaml.safe_load("".join(lines))
+    except yaml.YAMLError as e:
+        raise FrontmatterError(f"YAML parsing error: {e}")
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise FrontmatterError("Frontmatter is not a mapping")
+    return data
+
+
+def read_header(file_path: Path) -> Dict:
+    """Read and parse only the frontmatter of a file.
+
+    Returns an empty dict if the file has no frontmatter. The body is never
+    read, so this stays cheap however large the file is.
+    """
+    with open(file_path, encoding='utf-8') as f:
+        if f.readline().rstrip("\r\n") != "---":
+            return {}
+        lines = []
+        for line in f:
+            if line.rstrip() == "---":
+                return parse_header(lines)
+            lines.append(line)
+    raise FrontmatterError("Incomplete YAML frontmatter")
+
+
+def _plain_is_safe(text: str) -> bool:
+    """Check whether text survives as an unquoted YAML scalar."""
+    if not text or text != text.strip() or "\n" in text:
+        return False
+    return _simple_value(text) == text
+
+
+def format_value(value: Any) -> str:
+    """Serialise a value as a single-line YAML scalar or flow sequence."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        # Items are always quoted so characters like `*` or `,` stay literal
+        import json
+        return "[" + ", ".join(
+            json.dumps(item) if isinstance(item, str) else format_value(item)
+            for item in value
+        ) + "]"
+    text = str(value)
+    if _plain_is_safe(text):
+        return text
+    import json
+    return json.dumps(text)
+
+
+def _comment_start(line: str, start: int) -> int:
+    """Return where a trailing comment begins in line, or len(line)."""
+    quote = None
+    for i in range(start, len(line)):
+        char = line[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "#" and i > start and line[i - 1] in " \t":
+            return i
+    return len(line)
+
+
+class FrontmatterDocument:
+    """A markdown document whose frontmatter values can be patched in place."""
+
+    def __init__(self, text: str, header_end: int, body_start: int,
+                 data: Dict, spans: Dict[str, Tuple[int, int, str]]):
+        self.text = text
+        self.header_end = header_end
+        self.body_start = body_start
+        self.data = data
+        self.spans = spans
+        self._changes: Dict[str, Any] = {}
+
+    @classmethod
+    def parse(cls, text: str) -> "FrontmatterDocument":
+        """Parse text, recording where each top-level value lives."""
+        if not text.startswith("---"):
+            raise FrontmatterError("Missing YAML frontmatter")
+
+        first_newline = text.find("\n")
+        if first_newline == -1 or text[:first_newline].strip() != "---":
+            raise FrontmatterError("Missing YAML frontmatter")
+
+        # The header ends at the first line consisting only of ---
+        spans: Dict[str, Tuple[int, int, str]] = {}
+        current: Optional[str] = None
+        pos = first_newline + 1
+        header_end = body_start = -1
+
+        while pos <= len(text):
+            newline = text.find("\n", pos)
+            line_end = len(text) if newline == -1 else newline
+            line = text[pos:line_end].rstrip("\r")
+
+            if line.rstrip() == "---":
+                header_end = pos
+                body_start = line_end + 1 if newline != -1 else line_end
+                break
+
+            match = KEY_PATTERN.match(line)
+            if match:
+                current = match.group(1)
+                value_start = match.end()
+                value_text = line[value_start:]
+                separator = value_text[:len(value_text) - len(value_text.lstrip(" \t"))]
+                value_end = _comment_start(line, value_start + len(separator))
+                value_end = len(line[:value_end].rstrip(" \t"))
+                if not value_text.strip() or value_text.strip().startswith("#"):
+                    # Block value on following lines; patch from the colon onwards
+                    separator, value_end = "", value_start
+                spans[current] = (pos + value_start, pos + value_end, separator)
+            elif current and line[:1] in (" ", "\t", "-") and line.strip():
+                # Continuation of the previous key's block value
+                start, _, separator = spans[current]
+                spans[current] = (start, pos + len(line), separator)
+            elif not line.strip() or line.lstrip().startswith("#"):
+                pass
+            else:
+                current = None
+
+            if newline == -1:
+                break
+            pos = newline + 1
+
+        if header_end == -1:
+            raise FrontmatterError("Incomplete YAML frontmatter")
+
+        data = parse_header(text[first_newline + 1:header_end].splitlines(keepends=True))
+
+        return cls(text, header_end, body_start, data, spans)
+
+    @property
+    def body(self) -> str:
+        """Return the body exactly as it appears after the closing marker."""
+        return self.text[self.body_start:]
+
+    def body_checksum(self) -> str:
+        return body_checksum(self.body)
+
+    def set(self, key: str, value: Any) -> None:
+        """Record a new value for key; unchanged values are not rewritten."""
+        if key in self.data and self.data[key] == value and type(self.data[key]) is type(value):
+            self._changes.pop(key, None)
+            return
+        self._changes[key] = value
+
+    def update(self, values: Dict[str, Any]) -> None:
+        for key, value in values.items():
+            self.set(key, value)
+
+    def render(self) -> str:
+        """Return the document with only the changed values patched."""
+        patches: List[Tuple[int, int, str]] = []
+        appended: List[str] = []
+
+        for key, value in self._changes.items():
+            if key in self.spans:
+                start, end, separator = self.spans[key]
+                patches.append((start, end, (separator or " ") + format_value(value)))
+            else:
+                appended.append(f"{key}: {format_value(value)}\n")
+
+        if appended:
+            patches.append((self.header_end, self.header_end, "".join(appended)))
+
+        text = self.text
+        for start, end, replacement in sorted(patches, reverse=True):
+            text = text[:start] + replacement + text[end:]
+        return text
+
@@ -0,0 +1,244 @@
+"""
+Frontmatter Schema Engine
+
+This module loads the declarative frontmatter schema
+(`context/spec/frontmatter-schema.json`) and compiles it once into one
+specialised validator function per file kind (context, rules, gemini).
+
+The schema is a small subset of JSON Schema: `type`, `enum`, `pattern`,
+`format`, `items`, `required`, `properties` and a local `$ref`. Two
+extensions cover what JSON Schema cannot express as warnings:
+
+- `format: timestamp` checks the `YYYY-MM-DD HH:MM` layout used by
+  `last_updated`
+- `x-warnings` lists conditional pattern checks that produce warnings
+  rather than errors
+
+Compiled validators take a frontmatter dict and return `(errors, warnings)`
+as lists of messages. Adding or changing a field only requires editing the
+JSON definition.
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+Messages = Tuple[List[str], List[str]]
+Check = Callable[[Any], Optional[str]]
+
+TYPE_NAMES = {
+    "string": ("string", str),
+    "boolean": ("boolean", bool),
+    "integer": ("integer", int),
+    "number": ("number", (int, float)),
+    "array": ("list", list),
+    "object": ("dict", dict),
+}
+
+TIMESTAMP_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})$')
+
+
+def _is_timestamp(value: str) -> bool:
+    """Check the YYYY-MM-DD HH:MM layout without going through strptime."""
+    match = TIMESTAMP_PATTERN.match(value)
+    if not match:
+        return False
+    try:
+        datetime(*map(int, match.groups()))
+    except ValueError:
+        return False
+    return True
+
+
+FORMATS: Dict[str, Callable[[str], bool]] = {
+    "timestamp": _is_timestamp,
+}
+
+
+class SchemaError(Exception):
+    """Raised when the schema definition itself is invalid."""
+
+
+def _type_check(field: str, type_name: str) -> Check:
+    label, expected = TYPE_NAMES[type_name]
+
+    if expected is int:
+        # bool is a subclass of int, but `true` is not an integer
+        def check(value: Any) -> Optional[str]:
+            if type(value) is not int:
+                return f"{field} must be {label}, got {type(value)}"
+            return None
+    else:
+        def check(value: Any) -> Optional[str]:
+            if not isinstance(value, expected):
+                return f"{field} must be {label}, got {type(value)}"
+            return None
+
+    return check
+
+
+def _compile_property(field: str, spec: Dict) -> List[Check]:
+    """Compile one property spec into an ordered list of checks."""
+    checks: List[Check] = []
+
+    type_name = spec.get("type")
+    if type_name is not None:
+        if type_name not in TYPE_NAMES:
+            raise SchemaError(f"{field}: unsupported type {type_name!r}")
+        checks.append(_type_check(field, type_name))
+
+    if "enum" in spec:
+        allowed = frozenset(spec["enum"])
+
+        def check_enum(value: Any) -> Optional[str]:
+            try:
+                if value in allowed:
+                    return None
+            except TypeError:
+                pass
+            return f"Invalid {field}: {value}"
+
+        checks.append(check_enum)
+
+    if "pattern" in spec:
+        match = re.compile(spec["pattern"]).match
+
+        def check_pattern(value: Any) -> Optional[str]:
+            if not isinstance(value, str) or not match(value):
+                return f"Invalid {field} format: {value}"
+            return None
+
+        checks.append(check_pattern)
+
+    if "format" in spec:
+        if spec["format"] not in FORMATS:
+            raise SchemaError(f"{field}: unsupported format {spec['format']!r}")
+        is_valid = FORMATS[spec["format"]]
+
+        def check_format(value: Any) -> Optional[str]:
+            if not isinstance(value, str) or not is_valid(value):
+                return f"Invalid {field} format: {value}"
+            return None
+
+        checks.append(check_format)
+
+    items = spec.get("items")
+    if items:
+        item_checks = _compile_property(f"{field} item", items)
+
+        def check_items(value: Any) -> Optional[str]:
+            if isinstance(value, list):
+                for item in value:
+                    for item_check in item_checks:
+                        message = item_check(item)
+                        if message:
+                            return message
+            return None
+
+        checks.append(check_items)
+
+    return checks
+
+
+class FrontmatterSchema:
+    """Compiled validators for every file kind in a schema definition."""
+
+    def __init__(self, definition: Dict):
+        self.definition = definition
+        self.validators: Dict[str, Callable[[Dict], Messages]] = {}
+
+        for kind, spec in definition.get("kinds", {}).items():
+            self.validators[kind] = self._compile_kind(kind, self._resolve(spec))
+
+    @classmethod
+    def load(cls, schema_path: Path) -> "FrontmatterSchema":
+        """Load and compile a schema definition from a JSON file."""
+        with open(schema_path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _resolve(self, spec: Dict) -> Dict:
+        """Merge a local `$ref` target under the spec's own keys."""
+        ref = spec.get("$ref")
+        if ref is None:
+            return spec
+
+        if not ref.startswith("#/"):
+            raise SchemaError(f"Only local references are supported: {ref}")
+        target: Any = self.definition
+        for part in ref[2:].split("/"):
+            target = target[part]
+        base = self._resolve(target)
+
+        merged = dict(base)
+        merged["required"] = list(base.get("required", [])) + [
+            field for field in spec.get("required", []) if field not in base.get("required", [])
+        ]
+        merged["properties"] = {**base.get("properties", {}), **spec.get("properties", {})}
+        merged["x-warnings"] = list(base.get("x-warnings", [])) + list(spec.get("x-warnings", []))
+        return merged
+
+    def _compile_kind(self, kind: str, spec: Dict) -> Callable[[Dict], Messages]:
+        """Build the validator function for one file kind."""
+        required = tuple(spec.get("required", ()))
+        field_checks = tuple(
+            (field, tuple(_compile_property(field, prop_spec)))
+            for field, prop_spec in spec.get("properties", {}).items()
+        )
+        field_checks = tuple((field, checks) for field, checks in field_checks if checks)
+
+        warning_rules = []
+        for rule in spec.get("x-warnings", []):
+            warning_rules.append((
+                tuple(rule.get("if", {}).items()),
+                rule["field"],
+                re.compile(rule["pattern"]).match,
+                rule["message"],
+            ))
+        warning_rules = tuple(warning_rules)
+
+        def validate(frontmatter: Dict) -> Messages:
+            missing = [field for field in required if field not in frontmatter]
+            if missing:
+                return [f"Missing required fields: {', '.join(missing)}"], []
+
+            errors: List[str] = []
+            for field, checks in field_checks:
+                if field not in frontmatter:
+                    continue
+                value = frontmatter[field]
+                for check in checks:
+                    message = check(value)
+                    if message:
+                        errors.append(message)
+                        break
+
+            warnings: List[str] = []
+            for conditions, field, match, message in warning_rules:
+                if all(frontmatter.get(key) == expected for key, expected in conditions):
+                    value = frontmatter.get(field)
+                    if isinstance(value, str) and not match(value):
+                        warnings.append(message.format(**frontmatter))
+
+            return errors, warnings
+
+        validate.__name__ = f"validate_{kind}"
+        return validate
+
+    def kinds(self) -> List[str]:
+        return list(self.validators)
+
+    def validate(self, kind: str, frontmatter: Dict) -> Messages:
+        """Validate one frontmatter dict against the schema for kind."""
+        if kind not in self.validators:
+            raise SchemaError(f"Unknown file kind: {kind}")
+        return self.validators[kind](frontmatter)
+
+    def validate_many(self, kind: str, frontmatters: List[Dict]) -> List[Messages]:
+        """Validate a batch of frontmatter dicts of the same kind in one call."""
+        if kind not in self.validators:
+            raise SchemaError(f"Unknown file kind: {kind}")
+        validate = self.validators[kind]
+        return [validate(frontmatter) for frontmatter in frontmatters]
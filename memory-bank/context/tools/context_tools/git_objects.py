@@ -0,0 +1,161 @@
+"""
+Git Object Store Access
+
+This module reads context files straight out of git's object store, so any
+revision can be validated without checking it out. Blobs are listed with
+`git ls-tree` and their contents streamed through a single long-lived
+`git cat-file --batch` process, which is shared across every revision read
+through the same GitObjectStore.
+"""
+
+import os
+import posixpath
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+
+class GitError(Exception):
+    """Raised when a git command fails or returns unexpected output."""
+
+
+class GitObjectStore:
+    """Owns the `git cat-file --batch` process for one repository."""
+
+    def __init__(self, work_dir: Path):
+        self.work_dir = Path(work_dir).resolve()
+        self.repo_root = Path(self._git("rev-parse", "--show-toplevel").strip())
+        self._cat_file: Optional[subprocess.Popen] = None
+
+    def _git(self, *args: str) -> str:
+        """Run a short git command and return its stdout."""
+        result = subprocess.run(
+            ["git", "-C", str(self.work_dir), *args],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise GitError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+        return result.stdout
+
+    def resolve(self, rev: str) -> str:
+        """Resolve a revision to its commit id."""
+        try:
+            return self._git("rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}").strip()
+        except GitError:
+            raise GitError(f"Unknown revision: {rev}")
+
+    def list_blobs(self, commit: str, prefix: str) -> Dict[str, str]:
+        """Map repo-relative paths under prefix to blob ids at commit."""
+        output = self._git("ls-tree", "-r", "-z", "--full-tree", commit, "--", prefix or ".")
+        blobs = {}
+        for record in output.split("\0"):
+            if not record:
+                continue
+            meta, path = record.split("\t", 1)
+            _, obj_type, obj_id = meta.split()
+            if obj_type == "blob":
+                blobs[path] = obj_id
+        return blobs
+
+    def read_blob(self, obj_id: str) -> bytes:
+        """Read one blob through the shared cat-file process."""
+        if self._cat_file is None:
+            self._cat_file = subprocess.Popen(
+                ["git", "-C", str(self.work_dir), "cat-file", "--batch"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+
+        self._cat_file.stdin.write(f"{obj_id}\n".encode("ascii"))
+        self._cat_file.stdin.flush()
+
+        header = self._cat_file.stdout.readline().decode("ascii").split()
+        if len(header) != 3:
+            raise GitError(f"Unexpected cat-file response for {obj_id}: {' '.join(header)}")
+
+        size = int(header[2])
+        data = self._cat_file.stdout.read(size)
+        self._cat_file.stdout.read(1)  # trailing newline
+        return data
+
+    def close(self) -> None:
+        """Shut down the cat-file process."""
+        if self._cat_file is not None:
+            self._cat_file.stdin.close()
+            self._cat_file.wait()
+            self._cat_file = None
+
+    def __enter__(self) -> "GitObjectStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RevisionTree:
+    """Read-only view of a directory at one git revision.
+
+    Paths are absolute working-tree paths under `root`, exactly as the
+    working-tree code would see them, so callers can switch between the
+    filesystem and a revision without changing how they build paths.
+    """
+
+    def __init__(self, store: GitObjectStore, rev: str, root: Path):
+        self.store = store
+        self.rev = rev
+        self.commit = store.resolve(rev)
+
+        self.root = Path(root).resolve()
+        self.prefix = self.root.relative_to(store.repo_root).as_posix()
+        if self.prefix == ".":
+            self.prefix = ""
+
+        self._blobs: Dict[str, str] = {}
+        for path, obj_id in store.list_blobs(self.commit, self.prefix).items():
+            rel = path[len(self.prefix) + 1:] if self.prefix else path
+            self._blobs[rel] = obj_id
+
+        self._dirs: Set[str] = {""}
+        for rel in self._blobs:
+            parent = posixpath.dirname(rel)
+            while parent and parent not in self._dirs:
+                self._dirs.add(parent)
+                parent = posixpath.dirname(parent)
+
+    def _rel(self, path: Path) -> Optional[str]:
+        """Return the normalised path relative to root, or None if outside it."""
+        rel = posixpath.normpath(os.path.relpath(str(path), str(self.root)).replace(os.sep, "/"))
+        if rel == ".":
+            return ""
+        if rel.startswith("../") or rel == "..":
+            return None
+        return rel
+
+    def exists(self, path: Path) -> bool:
+        rel = self._rel(path)
+        return rel is not None and (rel in self._blobs or rel in self._dirs)
+
+    def is_dir(self, path: Path) -> bool:
+        rel = self._rel(path)
+        return rel is not None and rel in self._dirs
+
+    def read_bytes(self, path: Path) -> bytes:
+        rel = self._rel(path)
+        if rel is None or rel not in self._blobs:
+            raise FileNotFoundError(f"{path} does not exist at {self.rev}")
+        return self.store.read_blob(self._blobs[rel])
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    def rglob(self, directory: Path, suffix: str) -> Iterator[Path]:
+        """Yield files under directory whose names end with suffix, in path order."""
+        rel_dir = self._rel(directory)
+        if rel_dir is None:
+            return
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        matches: List[str] = sorted(
+            rel for rel in self._blobs
+            if rel.startswith(prefix) and rel.endswith(suffix)
+        )
+        for rel in matches:
+            yield self.root / rel
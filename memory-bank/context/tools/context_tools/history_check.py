@@ -0,0 +1,222 @@
+"""
+Version History Check
+
+This module cross-checks live context files against their version history in
+a single pass. The versions tree is scanned once into an in-memory index of
+history directory -> sorted versions, and every live file is checked against
+it for:
+- A history entry for the current version
+- History entries no newer than the current version, with non-decreasing dates
+- Recorded versions and checksums matching the entry name and live file
+- History stored under the path the tools expect (entrypoint.md is special-cased)
+
+Missing entries can be written in one batch with `backfill`.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .frontmatter_editor import FrontmatterDocument, FrontmatterError
+from .history_store import (LIVE_DIRS, HistoryStore, history_dir_for, iter_live_files,
+                            version_sort_key)
+
+
+ENTRY_VERSION = re.compile(r'^\*\*Version\*\*:\s*(\S+)', re.MULTILINE)
+ENTRY_DATE = re.compile(r'^\*\*Date\*\*:\s*(\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2})?)', re.MULTILINE)
+ENTRY_CHECKSUM = re.compile(r'^## File Checksum\s*\n(\S+)', re.MULTILINE)
+
+
+def parse_history_entry(content: str) -> Dict[str, Optional[str]]:
+    """Extract the recorded version, date and checksum of a history entry."""
+    fields = {}
+    for name, pattern in (("version", ENTRY_VERSION), ("date", ENTRY_DATE),
+                          ("checksum", ENTRY_CHECKSUM)):
+        match = pattern.search(content)
+        fields[name] = match.group(1) if match else None
+    return fields
+
+
+class HistoryChecker:
+    """Checks every live file against a single scan of the versions tree."""
+    
+    def __init__(self, context_root: str = "memory-bank"):
+        self.context_root = Path(context_root).resolve()
+        self.versions_dir = self.context_root / "context" / "versions"
+        self.history_store = HistoryStore(self.versions_dir)
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        # (file_path, history_dir, version, metadata) for each missing entry
+        self.missing: List[Tuple[Path, str, str, Dict]] = []
+        self.stats = {"files": 0, "dirs": 0, "entries": 0}
+    
+    def live_files(self):
+        """Yield live context files (.md and .mdc), skipping history, spec and virtualenv files."""
+        for name in LIVE_DIRS:
+            scan_dir = self.context_root / name
+            if not scan_dir.exists():
+                print(f"Warning: Directory {scan_dir} does not exist")
+        yield from iter_live_files(self.context_root)
+    
+    def check(self) -> bool:
+        """Run the check, returning False if any errors were found."""
+        index = self.history_store.scan()
+        self.stats["dirs"] = len(index)
+        self.stats["entries"] = sum(len(entries) for entries in index.values())
+        
+        claimed: Dict[str, Path] = {}
+        naive_dirs: Dict[str, Tuple[Path, str]] = {}
+        
+        for file_path in self.live_files():
+            try:
+                document = FrontmatterDocument.parse(file_path.read_text(encoding='utf-8'))
+            except (FrontmatterError, OSError) as e:
+                self.warnings.append(f"{file_path}: Skipped: {e}")
+                continue
+            
+            version = str(document.data.get("version", ""))
+            if not version:
+                continue
+            
+            self.stats["files"] += 1
+            rel_path = file_path.relative_to(self.context_root)
+            history_dir = history_dir_for(rel_path)
+            claimed[history_dir] = file_path
+            naive_dirs[(rel_path.parent / rel_path.stem).as_posix()] = (file_path, history_dir)
+            
+            self.check_file(file_path, document, version, history_dir, index.get(history_dir, []))
+        
+        for history_dir in sorted(set(index) - set(claimed)):
+            naive = naive_dirs.get(history_dir)
+            if naive:
+                # e.g. entrypoint history written to versions/context/entrypoint/
+                file_path, expected = naive
+                self.errors.append(
+                    f"{file_path}: History entries under versions/{history_dir}/ "
+                    f"belong in versions/{expected}/"
+                )
+            else:
+                self.warnings.append(f"versions/{history_dir or '.'}/: No live file for this history")
+        
+        return not self.errors
+    
+    def check_file(self, file_path: Path, document: FrontmatterDocument, version: str,
+                   history_dir: str, entries: List[Tuple[str, str]]) -> None:
+        """Check one live file against its history entries (oldest first)."""
+        current_key = version_sort_key(version)
+        versions = [entry_version for entry_version, _ in entries]
+        live_checksum = document.body_checksum()
+        
+        if version not in versions:
+            # A backfilled entry records the body as it is now
+            metadata = dict(document.data, checksum=live_checksum)
+            self.missing.append((file_path, history_dir, version, metadata))
+        
+        previous: Optional[Tuple[str, str]] = None
+        for entry_version, location in entries:
+            entry_key = version_sort_key(entry_version)
+            if entry_key is None:
+                self.warnings.append(
+                    f"{file_path}: History entry {entry_version} is not a semantic version"
+                )
+                continue
+            
+            if current_key is not None and entry_key > current_key:
+                self.errors.append(
+                    f"{file_path}: History entry {entry_version} is newer than "
+                    f"current version {version}"
+                )
+            
+            try:
+                content = self.history_store.read_version(history_dir, entry_version)
+            except (OSError, ValueError, UnicodeDecodeError) as e:
+                self.errors.append(f"{file_path}: Cannot read history entry {entry_version}: {e}")
+                continue
+            
+            recorded = parse_history_entry(content)
+            if recorded["version"] and recorded["version"] != entry_version:
+                self.errors.append(
+                    f"{file_path}: History entry {entry_version} ({location}) "
+                    f"records version {recorded['version']}"
+                )
+            
+            if recorded["date"]:
+                if previous and recorded["date"] < previous[1]:
+                    self.errors.append(
+                        f"{file_path}: History entry {entry_version} is dated {recorded['date']}, "
+                        f"before {previous[0]} ({previous[1]})"
+                    )
+                previous = (entry_version, recorded["date"])
+            
+            if entry_version != version:
+                continue
+            if recorded["checksum"] and "placeholder" in recorded["checksum"]:
+                self.warnings.append(
+                    f"{file_path}: History entry {entry_version} records a placeholder checksum"
+                )
+            elif recorded["checksum"] != live_checksum:
+                self.errors.append(
+                    f"{file_path}: History entry {entry_version} checksum does not match the file\n"
+                    f"  Recorded: {recorded['checksum']}\n"
+                    f"  Calculated: {live_checksum}"
+                )
+    
+    def backfill(self) -> int:
+        """Write a history entry for every missing current version in one batch."""
+        if not self.missing:
+            return 0
+        
+        from .version_manager import ContextVersionManager
+        manager = ContextVersionManager(str(self.context_root))
+        
+        batch = []
+        for file_path, history_dir, version, metadata in self.missing:
+            content = manager.generate_version_history_content(file_path, version, metadata)
+            batch.append((history_dir, version, content))
+        
+        for path in self.history_store.write_entries(batch):
+            print(f"Created version history: {path}")
+        
+        written = len(batch)
+        self.missing = []
+        return written
+    
+    def report(self) -> None:
+        """Print a summary of the last check."""
+        print(f"History Check Summary:")
+        print(f"  Live files: {self.stats['files']}")
+        print(f"  History directories: {self.stats['dirs']}")
+        print(f"  History entries: {self.stats['entries']}")
+        print(f"  Missing entries: {len(self.missing)}")
+        print(f"  Errors: {len(self.errors)}")
+        print(f"  Warnings: {len(self.warnings)}")
+        
+        if self.missing:
+            print(f"\nMissing History Entries:")
+            for file_path, history_dir, version, _ in self.missing:
+                print(f"  ➕ {file_path}: {version} (versions/{history_dir}/{version}.md)")
+        
+        if self.errors:
+            print(f"\nHistory Errors:")
+            for error in self.errors:
+                print(f"  ❌ {error}")
+        
+        if self.warnings:
+            print(f"\nHistory Warnings:")
+            for warning in self.warnings:
+                print(f"  ⚠️  {warning}")
+
+
+def check_history(context_root: str = "memory-bank", backfill: bool = False) -> bool:
+    """Check the versions tree against live files, optionally backfilling gaps."""
+    checker = HistoryChecker(context_root)
+    ok = checker.check()
+    checker.report()
+    
+    if backfill:
+        written = checker.backfill()
+        print(f"\nBackfilled {written} history entries")
+    elif checker.missing:
+        print(f"\nRun with --backfill to write the missing entries")
+    
+    return ok
@@ -0,0 +1,471 @@
+"""
+Version History Store
+
+This module provides read and compaction access to the version history tree
+(`context/versions/`). History entries are either loose files
+(`versions/<path>/<stem>/<version>.md`) or records in an append-only pack
+file with a sorted index, in the spirit of git packfiles:
+
+- `history.pack` holds the raw entry bytes, appended one after another
+- `history.idx` names the pack it describes and holds one sorted line per
+  entry: key, offset, length, sha256
+
+Rewriting the pack writes a new generation (`history-<n>.pack`) next to the
+old one. Replacing the index is the commit point: until it lands, readers
+keep using the old pack with the old offsets.
+
+A key is the entry path relative to `versions/` without the `.md` suffix,
+for example `rules/terminal-safety/1.0.0`.
+"""
+
+import bisect
+import hashlib
+import os
+import re
+from pathlib import Path, PurePath
+from typing import Dict, List, Optional, Set, Tuple
+
+
+PACK_NAME = "history.pack"
+INDEX_NAME = "history.idx"
+PACK_MAGIC = b"CTXPACK1\n"
+INDEX_MAGIC = "CTXIDX1"
+
+# The entrypoint keeps its history at versions/entrypoint/ rather than
+# versions/context/entrypoint/
+ENTRYPOINT_PATH = "context/entrypoint.md"
+ENTRYPOINT_HISTORY_DIR = "entrypoint"
+
+SEMVER_PATTERN = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?$')
+
+
+def version_sort_key(version: str) -> Optional[Tuple]:
+    """Return a semver ordering key, or None if the version is not semver.
+
+    Pre-release versions sort before their release (1.0.0-alpha.1 < 1.0.0),
+    and numeric pre-release identifiers sort before alphanumeric ones.
+    """
+    match = SEMVER_PATTERN.match(version)
+    if not match:
+        return None
+
+    major, minor, patch, pre = match.groups()
+    core = (int(major), int(minor), int(patch))
+    if pre is None:
+        return core + (1, ())
+
+    identifiers = tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in pre.split(".")
+    )
+    return core + (0, identifiers)
+
+
+LIVE_DIRS = ("context", "rules", "gemini")
+LIVE_SUFFIXES = (".md", ".mdc")
+
+
+def iter_live_files(context_root: Path):
+    """Yield live context files (.md and .mdc) in path order.
+
+    History, spec and virtualenv files are skipped; missing directories are
+    ignored.
+    """
+    for name in LIVE_DIRS:
+        scan_dir = Path(context_root) / name
+        if not scan_dir.is_dir():
+            continue
+        for file_path in sorted(scan_dir.rglob("*")):
+            parts = file_path.relative_to(context_root).parts
+            if (file_path.suffix not in LIVE_SUFFIXES or "versions" in parts or
+                    "spec" in parts or "venv" in parts or not file_path.is_file()):
+                continue
+            yield file_path
+
+
+def history_dir_for(rel_path: PurePath) -> str:
+    """Return the history directory of a live file, relative to versions/.
+
+    rel_path is the file's path relative to the context root.
+    """
+    if rel_path.as_posix() == ENTRYPOINT_PATH:
+        return ENTRYPOINT_HISTORY_DIR
+    return (rel_path.parent / rel_path.stem).as_posix()
+
+
+PACK_GENERATION = re.compile(r'^history(?:-(\d+))?\.pack$')
+
+
+def index_pack_name(text: str) -> str:
+    """Return the pack file an index refers to; indexes without one use history.pack."""
+    magic, _, pack_name = text.partition("\n")[0].partition("\t")
+    return pack_name or PACK_NAME
+
+
+def parse_index(text: str, source: object = INDEX_NAME) -> Dict[str, Tuple[int, int, str]]:
+    """Parse pack index text into {key: (offset, length, sha256)}."""
+    lines = text.splitlines()
+    if not lines or lines[0].partition("\t")[0] != INDEX_MAGIC:
+        raise ValueError(f"Invalid pack index header in {source}")
+
+    index: Dict[str, Tuple[int, int, str]] = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        key, offset, length, digest = line.split("\t")
+        index[key] = (int(offset), int(length), digest)
+    return index
+
+
+class HistoryStore:
+    """Reads history entries from loose files and the pack, and compacts them."""
+
+    def __init__(self, versions_dir: Path):
+        self.versions_dir = Path(versions_dir)
+        self.index_path = self.versions_dir / INDEX_NAME
+        self._pack_name = PACK_NAME
+        self._index: Optional[Dict[str, Tuple[int, int, str]]] = None
+        self._sorted_keys: List[str] = []
+
+    @property
+    def pack_path(self) -> Path:
+        """The pack file named by the current index."""
+        self._load_index()
+        return self.versions_dir / self._pack_name
+
+    # ------------------------------------------------------------------
+    # Index handling
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, Tuple[int, int, str]]:
+        """Load the pack index once and keep it in memory."""
+        if self._index is not None:
+            return self._index
+
+        index: Dict[str, Tuple[int, int, str]] = {}
+        pack_name = PACK_NAME
+        if self.index_path.exists():
+            text = self.index_path.read_text(encoding='utf-8')
+            index = parse_index(text, self.index_path)
+            pack_name = index_pack_name(text)
+
+        self._index = index
+        self._pack_name = pack_name
+        self._sorted_keys = sorted(index)
+        return index
+
+    def reload(self) -> None:
+        """Forget the cached index so the next access rereads it from disk."""
+        self._index = None
+
+    def _write_index(self, index: Dict[str, Tuple[int, int, str]],
+                     pack_name: Optional[str] = None) -> None:
+        """Durably replace the index with the given entries, sorted by key.
+
+        The rename is atomic, so readers see either the old index and pack or
+        the new ones.
+        """
+        pack_name = pack_name or self._pack_name
+        lines = [f"{INDEX_MAGIC}\t{pack_name}"]
+        for key in sorted(index):
+            offset, length, digest = index[key]
+            lines.append(f"{key}\t{offset}\t{length}\t{digest}")
+
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.index_path)
+        self._fsync_dir()
+
+        self._index = dict(index)
+        self._pack_name = pack_name
+        self._sorted_keys = sorted(index)
+
+    def _fsync_dir(self) -> None:
+        """Make renames in versions/ durable where the platform allows it."""
+        try:
+            fd = os.open(self.versions_dir, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _packed_versions(self, rel_dir: str) -> List[str]:
+        """Return packed versions stored directly under rel_dir."""
+        self._load_index()
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+
+        versions = []
+        for key in self._sorted_keys[start:]:
+            if not key.startswith(prefix):
+                break
+            name = key[len(prefix):]
+            if "/" not in name:
+                versions.append(name)
+        return versions
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _key(self, rel_dir: str, version: str) -> str:
+        return f"{rel_dir}/{version}" if rel_dir else version
+
+    def loose_path(self, rel_dir: str, version: str) -> Path:
+        """Return the loose file path for a history entry."""
+        return self.versions_dir / rel_dir / f"{version}.md"
+
+    def has_version(self, rel_dir: str, version: str) -> bool:
+        """Check whether a history entry exists, loose or packed."""
+        if self.loose_path(rel_dir, version).exists():
+            return True
+        return self._key(rel_dir, version) in self._load_index()
+
+    def read_version(self, rel_dir: str, version: str) -> Optional[str]:
+        """Read a history entry, preferring the loose file over the pack."""
+        loose = self.loose_path(rel_dir, version)
+        if loose.exists():
+            return loose.read_text(encoding='utf-8')
+
+        entry = self._load_index().get(self._key(rel_dir, version))
+        if entry is None:
+            return None
+
+        offset, length, digest = entry
+        with open(self.pack_path, "rb") as pack:
+            pack.seek(offset)
+            data = pack.read(length)
+
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Pack entry {self._key(rel_dir, version)} is corrupt")
+
+        return data.decode('utf-8')
+
+    def list_versions(self, rel_dir: str) -> List[Tuple[str, str]]:
+        """List (version, location) pairs for a history directory, oldest first.
+
+        Location is "loose" or "packed". A version present in both places is
+        reported once as loose.
+        """
+        found: Dict[str, str] = {}
+        for version in self._packed_versions(rel_dir):
+            found[version] = "packed"
+
+        loose_dir = self.versions_dir / rel_dir
+        if loose_dir.is_dir():
+            for entry in loose_dir.iterdir():
+                if entry.is_file() and entry.suffix == ".md":
+                    found[entry.stem] = "loose"
+
+        return sorted(found.items(), key=lambda item: self._ordering(item[0]))
+
+    def scan(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Map every history directory to its (version, location) pairs, oldest first.
+
+        Walks the loose tree once and merges the pack index, so callers can
+        check many files without a lookup per file.
+        """
+        found: Dict[str, Dict[str, str]] = {}
+        for key in self._load_index():
+            rel_dir, _, version = key.rpartition("/")
+            found.setdefault(rel_dir, {})[version] = "packed"
+
+        for directory, _, names in os.walk(self.versions_dir):
+            rel_dir = Path(directory).relative_to(self.versions_dir).as_posix()
+            rel_dir = "" if rel_dir == "." else rel_dir
+            for name in names:
+                if name.endswith(".md"):
+                    found.setdefault(rel_dir, {})[name[:-len(".md")]] = "loose"
+
+        return {
+            rel_dir: sorted(versions.items(), key=lambda item: self._ordering(item[0]))
+            for rel_dir, versions in found.items()
+        }
+
+    @staticmethod
+    def _ordering(version: str) -> Tuple:
+        key = version_sort_key(version)
+        # Non-semver names sort after every semver version, alphabetically
+        return (0, key) if key is not None else (1, version)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def write_entries(self, entries: List[Tuple[str, str, str]]) -> List[Path]:
+        """Write (rel_dir, version, content) entries as loose files.
+
+        Each file is written atomically; the written paths are returned.
+        """
+        written = []
+        for rel_dir, version, content in entries:
+            path = self.loose_path(rel_dir, version)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            tmp_path.write_text(content, encoding='utf-8')
+            os.replace(tmp_path, path)
+            written.append(path)
+        return written
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def history_dirs(self) -> List[str]:
+        """Return every history directory (loose or packed), relative to versions/."""
+        dirs = set()
+        for path in self.versions_dir.rglob("*.md"):
+            if path.is_file():
+                rel_parent = path.parent.relative_to(self.versions_dir).as_posix()
+                dirs.add("" if rel_parent == "." else rel_parent)
+
+        for key in self._load_index():
+            dirs.add(key.rpartition("/")[0])
+
+        return sorted(dirs)
+
+    def compact(self, keep: int, prune: bool = False, dry_run: bool = False,
+                protect: Optional[Set[str]] = None,
+                claimed: Optional[Set[str]] = None) -> Dict[str, int]:
+        """Move history entries beyond the newest `keep` per file out of the loose tree.
+
+        Without `prune`, old loose entries are appended to the pack and then
+        removed from disk. With `prune`, entries beyond retention are dropped
+        entirely, both loose and packed, and the pack is rewritten to reclaim
+        the space. Entries whose names are not semantic versions are never
+        touched, since their age cannot be determined. Keys in `protect`
+        (typically the current version of each live file) are never pruned.
+        
+        Pruning only applies to history directories in `claimed` (those of
+        live files). Entries beyond retention elsewhere, whose file may have
+        been renamed or whose version names may not mean what they appear to,
+        are packed instead and counted as "unclaimed".
+        """
+        if keep < 0:
+            raise ValueError(f"Retention must be non-negative, got {keep}")
+
+        protect = protect or set()
+        claimed = claimed or set()
+        # Callers hold the compaction lock; start from the index on disk
+        self.reload()
+        index = dict(self._load_index())
+        stats = {"packed": 0, "pruned": 0, "kept": 0, "unclaimed": 0}
+        to_pack: List[Tuple[str, Path]] = []
+        to_delete: List[Path] = []
+        drop_keys: List[str] = []
+
+        for rel_dir in self.history_dirs():
+            entries = [
+                (version, location) for version, location in self.list_versions(rel_dir)
+                if version_sort_key(version) is not None
+            ]
+            cutoff = max(len(entries) - keep, 0)
+            old, recent = entries[:cutoff], entries[cutoff:]
+            stats["kept"] += len(recent)
+
+            for version, location in old:
+                key = self._key(rel_dir, version)
+                loose = self.loose_path(rel_dir, version)
+                if prune and rel_dir not in claimed:
+                    stats["unclaimed"] += 1
+                if prune and rel_dir in claimed and key not in protect:
+                    stats["pruned"] += 1
+                    if location == "loose":
+                        to_delete.append(loose)
+                    if key in index:
+                        drop_keys.append(key)
+                elif location == "loose":
+                    # Protected and unclaimed entries beyond retention are packed, not pruned
+                    stats["packed"] += 1
+                    to_pack.append((key, loose))
+                    # A stale packed copy is superseded by the loose file
+                    index.pop(key, None)
+
+        if dry_run:
+            return stats
+
+        if to_pack:
+            self._append_to_pack(index, to_pack)
+            to_delete.extend(path for _, path in to_pack)
+
+        if drop_keys:
+            for key in drop_keys:
+                index.pop(key, None)
+            self._repack(index)
+        elif to_pack:
+            self._write_index(index)
+
+        # Only remove loose files once the index that covers them is durable
+        for path in to_delete:
+            path.unlink()
+            self._remove_empty_parents(path.parent)
+
+        return stats
+
+    def _append_to_pack(self, index: Dict[str, Tuple[int, int, str]],
+                        entries: List[Tuple[str, Path]]) -> None:
+        """Append loose entries to the pack and record their offsets in index."""
+        new_pack = not self.pack_path.exists() or self.pack_path.stat().st_size == 0
+
+        with open(self.pack_path, "ab") as pack:
+            if new_pack:
+                pack.write(PACK_MAGIC)
+            offset = pack.tell()
+            for key, path in entries:
+                data = path.read_bytes()
+                pack.write(data)
+                index[key] = (offset, len(data), hashlib.sha256(data).hexdigest())
+                offset += len(data)
+            pack.flush()
+            os.fsync(pack.fileno())
+
+    def _repack(self, index: Dict[str, Tuple[int, int, str]]) -> None:
+        """Rewrite the pack so it only contains entries still in index.
+
+        Entries are copied into the next pack generation; the old pack is only
+        removed after the index naming the new one has replaced the old index.
+        """
+        old_path = self.pack_path
+        match = PACK_GENERATION.match(old_path.name)
+        generation = int(match.group(1) or 0) + 1 if match else 1
+        new_path = self.versions_dir / f"history-{generation}.pack"
+        tmp_path = new_path.with_name(new_path.name + ".tmp")
+        new_index: Dict[str, Tuple[int, int, str]] = {}
+
+        if index:
+            with open(old_path, "rb") as old_pack, open(tmp_path, "wb") as new_pack:
+                new_pack.write(PACK_MAGIC)
+                for key in sorted(index, key=lambda k: index[k][0]):
+                    offset, length, digest = index[key]
+                    old_pack.seek(offset)
+                    data = old_pack.read(length)
+                    new_index[key] = (new_pack.tell(), length, digest)
+                    new_pack.write(data)
+                new_pack.flush()
+                os.fsync(new_pack.fileno())
+            # Not referenced by any index yet, so the rename is invisible to readers
+            os.replace(tmp_path, new_path)
+
+        self._write_index(new_index, new_path.name)
+
+        # Committed: drop the old pack and any generation left by an interrupted run
+        for path in self.versions_dir.iterdir():
+            stale_pack = PACK_GENERATION.match(path.name) and path.name != new_path.name
+            stale_tmp = path.name.startswith("history") and path.name.endswith(".pack.tmp")
+            if stale_pack or stale_tmp:
+                path.unlink()
+
+    def _remove_empty_parents(self, directory: Path) -> None:
+        """Remove directories left empty by compaction, up to versions/."""
+        while directory != self.versions_dir and directory.is_dir():
+            if any(directory.iterdir()):
+                break
+            directory.rmdir()
+            directory = directory.parent
@@ -0,0 +1,340 @@
+"""
+Validation Metrics Store
+
+This module keeps an append-only history of validation runs in a local SQLite
+database (`<context_root>/.metrics/validation.sqlite3`) and reports trends
+from it without rereading the bank. Each run records:
+- Run totals: time, mode, root hash, file count, bank size, errors, warnings
+- Per-phase timings (read, parse, schema, checksum, dependencies, history)
+- Per-file status, error codes and duration
+
+Rows are only ever inserted. File paths are stored once in a lookup table and
+referenced by id, so a run costs one small row per file. Serial and
+`--pipeline` runs time different work, so trends compare runs of one mode.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+METRICS_PATH = Path(".metrics") / "validation.sqlite3"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    root_hash TEXT NOT NULL,
+    files INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    warnings INTEGER NOT NULL,
+    duration_ms REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    phase TEXT NOT NULL,
+    duration_ms REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS paths (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS file_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    path_id INTEGER NOT NULL REFERENCES paths(id),
+    valid INTEGER NOT NULL,
+    codes TEXT NOT NULL,
+    duration_ms REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS file_results_run ON file_results(run_id);
+"""
+
+
+def median(values: List[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def root_hash(digests: List[Tuple[str, str]]) -> str:
+    """Hash (path, content digest) pairs into one value identifying the bank state."""
+    combined = hashlib.sha256()
+    for path, digest in sorted(digests):
+        combined.update(f"{path}\0{digest}\n".encode('utf-8'))
+    return f"sha256:{combined.hexdigest()}"
+
+
+class MetricsStore:
+    """Appends validation runs to a SQLite database and queries trends."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.db_path))
+
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            self.connection.close()
+            raise ValueError(f"{self.db_path}: Unsupported metrics schema version {version}")
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "MetricsStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record_run(self, run: Dict, phases: Dict[str, float], files: List[Dict]) -> int:
+        """Append one run, its phase timings and per-file results in one transaction.
+
+        run holds started_at, mode, root_hash, files, bytes, errors, warnings and
+        duration (seconds); phases maps phase -> seconds; each file result holds
+        path, status, codes and duration (seconds). Returns the run id.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started_at, mode, root_hash, files, bytes, errors, warnings, "
+                "duration_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (run["started_at"], run["mode"], run["root_hash"], run["files"], run["bytes"],
+                 run["errors"], run["warnings"], run["duration"] * 1000)
+            )
+            run_id = cursor.lastrowid
+
+            self.connection.executemany(
+                "INSERT INTO phases (run_id, phase, duration_ms) VALUES (?, ?, ?)",
+                [(run_id, phase, seconds * 1000) for phase, seconds in sorted(phases.items())]
+            )
+
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO paths (path) VALUES (?)",
+                [(result["path"],) for result in files]
+            )
+            path_ids = dict(self.connection.execute("SELECT path, id FROM paths"))
+            self.connection.executemany(
+                "INSERT INTO file_results (run_id, path_id, valid, codes, duration_ms) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(run_id, path_ids[result["path"]], int(result["status"] == "valid"),
+                  ",".join(sorted(result["codes"])), result["duration"] * 1000)
+                 for result in files]
+            )
+
+        return run_id
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def latest_mode(self) -> Optional[str]:
+        """Return the mode of the most recent run, or None if there are no runs."""
+        row = self.connection.execute("SELECT mode FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def recent_run_ids(self, runs: int, mode: str) -> List[int]:
+        """Return the ids of the last `runs` runs in the given mode, oldest first."""
+        rows = self.connection.execute(
+            "SELECT id FROM runs WHERE mode = ? ORDER BY id DESC LIMIT ?", (mode, runs)
+        ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def slowest_files(self, run_ids: List[int], limit: int) -> List[Tuple[str, float, float, int]]:
+        """Return (path, mean ms, max ms, runs) for the slowest files in the given runs."""
+        if not run_ids:
+            return []
+        placeholders = ",".join("?" * len(run_ids))
+        return self.connection.execute(
+            f"SELECT paths.path, AVG(duration_ms), MAX(duration_ms), COUNT(*) "
+            f"FROM file_results JOIN paths ON paths.id = file_results.path_id "
+            f"WHERE run_id IN ({placeholders}) "
+            f"GROUP BY path_id ORDER BY AVG(duration_ms) DESC LIMIT ?",
+            (*run_ids, limit)
+        ).fetchall()
+
+    def flakiest_checks(self, run_ids: List[int], limit: int) -> List[Tuple[str, int, int]]:
+        """Return (code, flips, files) for checks whose outcome flips between runs.
+
+        A flip is a file gaining or losing a code between two consecutive runs
+        that both validated it.
+        """
+        if not run_ids:
+            return []
+        placeholders = ",".join("?" * len(run_ids))
+        rows = self.connection.execute(
+            f"SELECT path_id, codes FROM file_results WHERE run_id IN ({placeholders}) "
+            f"ORDER BY path_id, run_id",
+            run_ids
+        ).fetchall()
+
+        history: Dict[int, List[set]] = {}
+        for path_id, codes in rows:
+            history.setdefault(path_id, []).append(set(codes.split(",")) - {""})
+
+        flips: Dict[str, int] = {}
+        flaky_files: Dict[str, set] = {}
+        for path_id, outcomes in history.items():
+            for before, after in zip(outcomes, outcomes[1:]):
+                for code in before ^ after:
+                    flips[code] = flips.get(code, 0) + 1
+                    flaky_files.setdefault(code, set()).add(path_id)
+
+        ranked = sorted(flips.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(code, count, len(flaky_files[code])) for code, count in ranked]
+
+    def growth(self, run_ids: List[int]) -> Optional[Dict]:
+        """Compare the first and last of the given runs: size, duration and elapsed days."""
+        if len(run_ids) < 2:
+            return None
+        query = "SELECT started_at, files, bytes, duration_ms FROM runs WHERE id = ?"
+        first = self.connection.execute(query, (run_ids[0],)).fetchone()
+        last = self.connection.execute(query, (run_ids[-1],)).fetchone()
+
+        from datetime import datetime
+        days = (datetime.fromisoformat(last[0]) - datetime.fromisoformat(first[0])).total_seconds() / 86400
+        return {
+            "days": days,
+            "files": (first[1], last[1]),
+            "bytes": (first[2], last[2]),
+            "duration_ms": (first[3], last[3]),
+        }
+
+    def phase_regressions(self, run_ids: List[int], recent: int,
+                          threshold: float) -> List[Tuple[str, float, float, bool]]:
+        """Compare each phase's median time in the last `recent` runs with the runs before.
+
+        Returns (phase, baseline ms, recent ms, regressed) for every phase seen in
+        both windows. A phase regressed when it is more than `threshold` times
+        slower and at least a millisecond slower, so noise on tiny phases is ignored.
+        """
+        if len(run_ids) <= recent:
+            return []
+        baseline_ids, recent_ids = set(run_ids[:-recent]), set(run_ids[-recent:])
+        placeholders = ",".join("?" * len(run_ids))
+
+        timings: Dict[str, Tuple[List[float], List[float]]] = {}
+        for run_id, phase, duration_ms in self.connection.execute(
+                f"SELECT run_id, phase, duration_ms FROM phases WHERE run_id IN ({placeholders})",
+                run_ids):
+            baseline, latest = timings.setdefault(phase, ([], []))
+            (latest if run_id in recent_ids else baseline).append(duration_ms)
+
+        report = []
+        for phase, (baseline, latest) in sorted(timings.items()):
+            if not baseline or not latest:
+                continue
+            before, after = median(baseline), median(latest)
+            regressed = after > before * threshold and after - before >= 1.0
+            report.append((phase, before, after, regressed))
+        return report
+
+
+def metrics_path(context_root: str) -> Path:
+    return Path(context_root).resolve() / METRICS_PATH
+
+
+def record_validation(context_root: str, validator, mode: str, duration: float) -> bool:
+    """Append a finished validation run to the bank's metrics store."""
+    from datetime import datetime
+
+    root = Path(context_root).resolve()
+    files = []
+    digests = []
+    total_bytes = 0
+    for result in validator.file_results:
+        path = Path(result["path"]).resolve().relative_to(root).as_posix()
+        files.append(dict(result, path=path))
+        digests.append((path, result["digest"] or ""))
+        total_bytes += result["bytes"]
+
+    run = {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "mode": mode,
+        "root_hash": root_hash(digests),
+        "files": len(files),
+        "bytes": total_bytes,
+        "errors": len(validator.validation_errors),
+        "warnings": len(validator.validation_warnings),
+        "duration": duration,
+    }
+
+    try:
+        with MetricsStore(metrics_path(context_root)) as store:
+            store.record_run(run, validator.phase_times, files)
+    except (OSError, sqlite3.Error, ValueError) as e:
+        print(f"Warning: Could not record validation metrics: {e}")
+        return False
+    return True
+
+
+def show_trends(context_root: str = "memory-bank", runs: int = 30, limit: int = 5,
+                recent: int = 5, threshold: float = 1.5, mode: Optional[str] = None) -> bool:
+    """Print slowest files, flakiest checks, growth and phase regressions.
+
+    Only runs of one mode are compared; it defaults to the latest run's mode.
+    """
+    db_path = metrics_path(context_root)
+    if not db_path.exists():
+        print(f"No validation metrics recorded yet ({db_path})")
+        return False
+
+    try:
+        store = MetricsStore(db_path)
+    except (sqlite3.Error, ValueError) as e:
+        print(f"Error: Could not open validation metrics: {e}")
+        return False
+
+    with store:
+        mode = mode or store.latest_mode()
+        if mode is None:
+            print(f"No validation metrics recorded yet ({db_path})")
+            return False
+        run_ids = store.recent_run_ids(runs, mode)
+        print(f"Validation Trends (last {len(run_ids)} {mode} runs):")
+
+        print(f"\nSlowest Files:")
+        for path, mean_ms, max_ms, count in store.slowest_files(run_ids, limit):
+            print(f"  {mean_ms:8.2f}ms mean  {max_ms:8.2f}ms max  {path} ({count} runs)")
+
+        print(f"\nFlakiest Checks:")
+        flaky = store.flakiest_checks(run_ids, limit)
+        if not flaky:
+            print(f"  No check changed outcome between runs")
+        for code, flips, files in flaky:
+            print(f"  {code}: {flips} flips across {files} files")
+
+        print(f"\nGrowth:")
+        growth = store.growth(run_ids)
+        if growth is None:
+            print(f"  Need at least two runs")
+        else:
+            days = growth["days"]
+            for label, key, unit in (("Files", "files", ""), ("Size", "bytes", " bytes"),
+                                     ("Validation time", "duration_ms", "ms")):
+                first, last = growth[key]
+                line = f"  {label}: {first:g}{unit} -> {last:g}{unit}"
+                if days >= 1:
+                    line += f" ({(last - first) / days:+.1f}{unit}/day)"
+                print(line)
+
+        print(f"\nPhase Timings (median of last {recent} runs vs earlier runs):")
+        regressions = store.phase_regressions(run_ids, recent, threshold)
+        if not regressions:
+            print(f"  Need more than {recent} runs")
+        for phase, before, after, regressed in regressions:
+            status = "❌" if regressed else "✅"
+            change = (after - before) / before if before else 0.0
+            print(f"  {status} {phase}: {before:.2f}ms -> {after:.2f}ms ({change:+.0%})")
+
+    return True
@@ -0,0 +1,242 @@
+"""
+Pipelined Validation
+
+On network filesystems every read and stat is a round trip, so validating
+files one after another leaves the link idle. This module runs the same
+checks as `ContextValidator.validate_all_files` as an asyncio pipeline:
+
+1. Read each file on a thread pool (I/O)
+2. Parse its frontmatter to find dependencies and the history entry (CPU)
+3. Stat and read dependencies and check the history entry (I/O)
+4. Validate schema, checksum, dependencies and history from the results (CPU)
+
+At most `concurrency` I/O operations are in flight at once, and at most
+`queue_depth` files are read ahead of the validation stage. Files are
+reported in discovery order, with the same messages as a serial run.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .validator import ContextValidator
+
+
+class PipelineValidator(ContextValidator):
+    """Validates the working tree with I/O overlapped with parsing and hashing.
+
+    The I/O stages fill caches that the inherited checks read from, so the
+    validation logic itself is shared with the serial validator. A cache miss
+    falls back to a direct read.
+    """
+
+    def __init__(self, context_root: str = "memory-bank", concurrency: int = 16,
+                 queue_depth: int = 64):
+        if concurrency < 1 or queue_depth < 1:
+            raise ValueError("Concurrency and queue depth must be at least 1")
+
+        super().__init__(context_root)
+        self.concurrency = concurrency
+        self.queue_depth = queue_depth
+
+        self._files: Dict[Path, str] = {}
+        self._dep_contents: Dict[Path, Optional[str]] = {}
+        self._history: Dict[Tuple[str, str], bool] = {}
+        self._history_dirs: Dict[Path, str] = {}
+        self._parsed: Dict[str, Tuple[Tuple[Dict, str], List[str]]] = {}
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.stats = {"files": 0, "io_ops": 0, "bytes": 0, "peak_in_flight": 0, "in_flight": 0}
+
+    # ------------------------------------------------------------------
+    # Cached I/O hooks used by the inherited checks
+    # ------------------------------------------------------------------
+
+    def read_file(self, path: Path) -> str:
+        if path in self._files:
+            return self._files[path]
+        content = self._dep_contents.get(path)
+        if content is not None:
+            return content
+        return super().read_file(path)
+
+    def path_exists(self, path: Path) -> bool:
+        if path in self._dep_contents:
+            return self._dep_contents[path] is not None
+        return super().path_exists(path)
+
+    def history_has_version(self, history_dir: str, version: str) -> bool:
+        cached = self._history.get((history_dir, version))
+        if cached is not None:
+            return cached
+        return super().history_has_version(history_dir, version)
+
+    def history_dir(self, file_path: Path) -> str:
+        # Resolving the path stats every component, so it is done in the I/O stage
+        if file_path in self._history_dirs:
+            return self._history_dirs[file_path]
+        return super().history_dir(file_path)
+
+    def parse_frontmatter(self, content: str) -> Tuple[Dict, str]:
+        # Reuse the parse stage's result, reporting its errors as a serial parse would
+        cached = self._parsed.get(content)
+        if cached is None:
+            return super().parse_frontmatter(content)
+        result, errors = cached
+        self.validation_errors.extend(errors)
+        return result
+
+    # ------------------------------------------------------------------
+    # Pipeline stages
+    # ------------------------------------------------------------------
+
+    async def _io(self, func: Callable, *args):
+        """Run a blocking I/O call on the pool, bounded by the concurrency limit."""
+        async with self._slots:
+            self.stats["io_ops"] += 1
+            self.stats["in_flight"] += 1
+            self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self.stats["in_flight"])
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
+            finally:
+                self.stats["in_flight"] -= 1
+
+    def _read_dependency(self, path: Path) -> Optional[str]:
+        """Read a dependency, or return None if it does not exist."""
+        try:
+            return super().read_file(path)
+        except FileNotFoundError:
+            return None
+
+    def _parse(self, content: str) -> Dict:
+        """Parse a file's frontmatter once, holding back errors for the check stage."""
+        start = len(self.validation_errors)
+        result = super().parse_frontmatter(content)
+        errors = self.validation_errors[start:]
+        del self.validation_errors[start:]
+        self._parsed[content] = (result, errors)
+        return result[0]
+
+    async def _fetch_dependency(self, path: Path) -> None:
+        if path in self._dep_contents:
+            return
+        try:
+            self._dep_contents[path] = await self._io(self._read_dependency, path)
+        except Exception:
+            pass  # Left uncached so the check stage reports the failure
+
+    def _check_history(self, file_path: Path, version: str) -> Tuple[str, bool]:
+        history_dir = super().history_dir(file_path)
+        return history_dir, super().history_has_version(history_dir, version)
+
+    async def _fetch_history(self, file_path: Path, version: str) -> None:
+        try:
+            history_dir, exists = await self._io(self._check_history, file_path, version)
+        except Exception:
+            return  # Left uncached so the check stage reports the failure
+        self._history_dirs[file_path] = history_dir
+        self._history[(history_dir, version)] = exists
+
+    async def _load(self, file_path: Path) -> None:
+        """Read a file, parse it, and prefetch everything its checks will touch."""
+        try:
+            content = await self._io(super().read_file, file_path)
+        except (OSError, UnicodeDecodeError):
+            return  # Reported by validate_file_structure's own read
+
+        self._files[file_path] = content
+        self.stats["bytes"] += len(content.encode('utf-8'))
+
+        frontmatter = self._parse(content)
+        if not isinstance(frontmatter, dict):
+            return
+
+        fetches = []
+        dependencies = frontmatter.get("dependencies")
+        if isinstance(dependencies, list) and all(isinstance(dep, str) for dep in dependencies):
+            fetches.extend(
+                self._fetch_dependency(dep_path)
+                for _, dep_path in self.dependency_paths(frontmatter, file_path)
+            )
+        version = frontmatter.get("version")
+        if version:
+            fetches.append(self._fetch_history(file_path, str(version)))
+
+        await asyncio.gather(*fetches)
+
+    def _release(self, file_path: Path) -> None:
+        """Drop a checked file's cached content and parse result."""
+        self._history_dirs.pop(file_path, None)
+        content = self._files.pop(file_path, None)
+        if content is not None:
+            self._parsed.pop(content, None)
+
+    async def _run(self) -> Tuple[int, int]:
+        loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+
+        async def produce():
+            try:
+                # Directory listing is I/O too, so it runs on the pool
+                files = await loop.run_in_executor(self._pool, list, self.context_files())
+                for file_path in files:
+                    # Blocks once queue_depth files are read ahead of the checks
+                    await queue.put((file_path, asyncio.ensure_future(self._load(file_path))))
+            finally:
+                # Always end the queue; a failure is re-raised by awaiting the producer
+                await queue.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        total_files = 0
+        valid_files = 0
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                file_path, loaded = item
+                await loaded
+
+                total_files += 1
+                if self.validate_file(file_path):
+                    valid_files += 1
+                self._release(file_path)
+            await producer
+        finally:
+            producer.cancel()
+
+        return total_files, valid_files
+
+    def validate_all_files(self) -> bool:
+        """Validate all context files through the pipeline and report throughput."""
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            self._pool = pool
+            total_files, valid_files = asyncio.run(self._run())
+
+        elapsed = time.perf_counter() - start
+        self.stats["files"] = total_files
+
+        valid = self.print_summary(total_files, valid_files)
+        self.print_throughput(elapsed)
+        return valid
+
+    def print_throughput(self, elapsed: float) -> None:
+        """Print achieved pipeline throughput."""
+        def rate(count: float) -> float:
+            return count / elapsed if elapsed > 0 else 0.0
+
+        print(f"\nPipeline Throughput:")
+        print(f"  Elapsed: {elapsed:.3f}s")
+        print(f"  Files: {self.stats['files']} ({rate(self.stats['files']):.1f}/s)")
+        print(f"  I/O operations: {self.stats['io_ops']} ({rate(self.stats['io_ops']):.1f}/s)")
+        print(f"  Read: {self.stats['bytes'] / 1024:.1f} KiB "
+              f"({rate(self.stats['bytes']) / 1024:.1f} KiB/s)")
+        print(f"  Peak in flight: {self.stats['peak_in_flight']} "
+              f"(concurrency {self.concurrency}, queue depth {self.queue_depth})")
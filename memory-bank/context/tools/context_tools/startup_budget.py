@@ -0,0 +1,65 @@
+"""
+Startup Budget
+
+Measures the import cost of the read-only commands with `python -X importtime`
+and fails when it exceeds the budget or when a command pulls in a module that
+is meant to be loaded lazily. Interpreter startup modules are measured once
+with an empty program and subtracted.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+ENTRY_POINT = Path(__file__).resolve().parent.parent / "context-tools.py"
+
+# Modules the read-only commands must not import
+LAZY_MODULES = ["yaml", "argparse", "hashlib", "datetime", "json"]
+
+
+def import_times(args: List[str]) -> Dict[str, Tuple[int, int]]:
+    """Run python -X importtime with args, returning {module: (self_us, cumulative_us)}."""
+    result = subprocess.run([sys.executable, "-X", "importtime"] + args,
+                            capture_output=True, text=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def check_startup_budget(context_root: str = "memory-bank", budget_ms: float = 60.0,
+                         runs: int = 3) -> bool:
+    """Check that read-only commands import within budget_ms (best of runs)."""
+    baseline = import_times(["-c", "pass"])
+    entrypoint = Path(context_root) / "context" / "entrypoint.md"
+    commands = [
+        ["list", "--context-root", context_root],
+        ["status", "--context-root", context_root, "--file", str(entrypoint)],
+    ]
+
+    ok = True
+    for command in commands:
+        measured = []
+        for _ in range(runs):
+            times = import_times([str(ENTRY_POINT)] + command)
+            extra = {name: t for name, t in times.items() if name not in baseline}
+            measured.append((sum(self_us for self_us, _ in extra.values()) / 1000, extra))
+        total_ms, extra = min(measured, key=lambda m: m[0])
+        lazy = [name for name in LAZY_MODULES if name in extra]
+
+        status = "✅" if total_ms <= budget_ms and not lazy else "❌"
+        print(f"{status} {command[0]}: {total_ms:.1f}ms imports across {len(extra)} modules "
+              f"(budget {budget_ms:.1f}ms)")
+        for name, (_, cumulative_us) in sorted(extra.items(), key=lambda item: -item[1][1])[:5]:
+            print(f"    {cumulative_us / 1000:6.1f}ms  {name}")
+        if lazy:
+            print(f"    imports lazily loaded modules: {', '.join(lazy)}")
+        if total_ms > budget_ms or lazy:
+            ok = False
+
+    return ok
@@ -0,0 +1,509 @@
+"""
+Context Validation
+
+This module validates context files in the memory-bank system for:
+- Version metadata consistency
+- Dependency integrity
+- Checksum validation
+- File structure compliance
+"""
+
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Set
+
+from .frontmatter_editor import FrontmatterDocument, FrontmatterError, body_checksum
+from .frontmatter_schema import FrontmatterSchema
+from .history_store import INDEX_NAME, HistoryStore, history_dir_for, parse_index
+
+
+# The schema ships alongside the tools rather than being read from the bank
+# being validated, so --rev checks older revisions against today's rules.
+SCHEMA_PATH = Path(__file__).resolve().parents[2] / "spec" / "frontmatter-schema.json"
+
+
+@lru_cache(maxsize=None)
+def load_schema(schema_path: Path = SCHEMA_PATH) -> FrontmatterSchema:
+    """Load and compile a schema once per process; validators share the result."""
+    return FrontmatterSchema.load(schema_path)
+
+
+class ContextValidator:
+    """Validates context files for version control consistency."""
+    
+    def __init__(self, context_root: str = "memory-bank"):
+        self.context_root = Path(context_root).resolve()
+        self.versions_dir = self.context_root / "context" / "versions"
+        self.history_store = HistoryStore(self.versions_dir)
+        self.schema = load_schema(SCHEMA_PATH)
+        self.validation_errors = []
+        self.validation_warnings = []
+        # Per-file outcomes and per-phase timings of validate_file, for run metrics
+        self.file_results: List[Dict] = []
+        self.phase_times: Dict[str, float] = {}
+        # Content digests are only needed for the metrics root hash
+        self.record_digests = False
+        self._current: Optional[Dict] = None
+        
+    @contextmanager
+    def phase(self, name: str):
+        """Time a validation phase and tag the current file with its failures.
+        
+        A file gets the code `<phase>-error` or `<phase>-warning` when the
+        phase added errors or warnings.
+        """
+        errors = len(self.validation_errors)
+        warnings = len(self.validation_warnings)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + time.perf_counter() - start
+            if self._current is not None:
+                if len(self.validation_errors) > errors:
+                    self._current["codes"].add(f"{name}-error")
+                if len(self.validation_warnings) > warnings:
+                    self._current["codes"].add(f"{name}-warning")
+    
+    def read_file(self, path: Path) -> str:
+        """Read a context file. Overridden to validate other sources."""
+        return path.read_text(encoding='utf-8')
+    
+    def path_exists(self, path: Path) -> bool:
+        """Check whether a path exists. Overridden to validate other sources."""
+        return path.exists()
+    
+    def iter_markdown_files(self, scan_dir: Path):
+        """Yield markdown files under scan_dir, or None if it does not exist."""
+        if not scan_dir.exists():
+            return None
+        return (path for path in scan_dir.rglob("*.md") if path.is_file())
+    
+    def history_has_version(self, history_dir: str, version: str) -> bool:
+        """Check whether a history entry exists, loose or packed."""
+        return self.history_store.has_version(history_dir, version)
+    
+    def parse_frontmatter(self, content: str) -> Tuple[Dict, str]:
+        """Parse YAML frontmatter the same way the editing tools do.
+        
+        The header ends at the first line that is only `---`, so the body and
+        its checksum agree with bump, fix-checksums and history-check.
+        """
+        if not content.startswith("---"):
+            return {}, content
+        
+        try:
+            document = FrontmatterDocument.parse(content)
+        except FrontmatterError as e:
+            self.validation_errors.append(str(e))
+            return {}, content
+        
+        return document.data, document.body
+    
+    def calculate_checksum(self, content: str) -> str:
+        """Calculate SHA256 checksum of content (excluding frontmatter)."""
+        _, body = self.parse_frontmatter(content)
+        return body_checksum(body)
+    
+    def file_kind(self, file_path: Path) -> str:
+        """Return the schema kind of a file from its top-level directory."""
+        try:
+            top = file_path.resolve().relative_to(self.context_root).parts[0]
+        except (ValueError, IndexError):
+            return "context"
+        return top if top in self.schema.validators else "context"
+    
+    def validate_schema(self, frontmatter: Dict, file_path: Path) -> bool:
+        """Validate frontmatter fields against the compiled schema for the file's kind."""
+        errors, warnings = self.schema.validate(self.file_kind(file_path), frontmatter)
+        
+        for error in errors:
+            self.validation_errors.append(f"{file_path}: {error}")
+        for warning in warnings:
+            self.validation_warnings.append(f"{file_path}: {warning}")
+        
+        return not errors
+    
+    def validate_checksum(self, frontmatter: Dict, content: str, file_path: Path) -> bool:
+        """Validate that stored checksum matches calculated checksum."""
+        stored_checksum = frontmatter.get("checksum", "")
+        calculated_checksum = self.calculate_checksum(content)
+        
+        if stored_checksum != calculated_checksum:
+            self.validation_errors.append(
+                f"{file_path}: Checksum mismatch\n"
+                f"  Stored: {stored_checksum}\n"
+                f"  Calculated: {calculated_checksum}"
+            )
+            return False
+        
+        return True
+    
+    def dependency_paths(self, frontmatter: Dict, file_path: Path) -> List[Tuple[str, Path]]:
+        """Return (dependency, resolved path) pairs; dependencies are relative to the file."""
+        return [(dep, file_path.parent / dep) for dep in frontmatter.get("dependencies", [])]
+    
+    def validate_dependencies(self, frontmatter: Dict, file_path: Path) -> bool:
+        """Validate that referenced dependencies exist."""
+        valid = True
+        
+        for dep, dep_path in self.dependency_paths(frontmatter, file_path):
+            if not self.path_exists(dep_path):
+                self.validation_errors.append(
+                    f"{file_path}: Dependency not found: {dep} -> {dep_path}"
+                )
+                valid = False
+            else:
+                # Check if dependency has version metadata
+                try:
+                    dep_content = self.read_file(dep_path)
+                    dep_frontmatter, _ = self.parse_frontmatter(dep_content)
+                    
+                    if not dep_frontmatter or "version" not in dep_frontmatter:
+                        self.validation_warnings.append(
+                            f"{file_path}: Dependency {dep} has no version metadata"
+                        )
+                except Exception as e:
+                    self.validation_warnings.append(
+                        f"{file_path}: Could not read dependency {dep}: {e}"
+                    )
+        
+        return valid
+    
+    def validate_file_structure(self, file_path: Path) -> bool:
+        """Validate file structure and markdown formatting."""
+        try:
+            with self.phase("read"):
+                content = self.read_file(file_path)
+            
+            if self._current is not None:
+                encoded = content.encode('utf-8')
+                self._current["bytes"] = len(encoded)
+                if self.record_digests:
+                    self._current["digest"] = hashlib.sha256(encoded).hexdigest()
+            
+            # Check if file has content
+            if not content.strip():
+                self.validation_errors.append(f"{file_path}: File is empty")
+                return False
+            
+            # Check if file has frontmatter
+            if not content.startswith("---"):
+                self.validation_errors.append(f"{file_path}: Missing YAML frontmatter")
+                return False
+            
+            # Check if frontmatter is properly closed by a line that is only ---
+            if not any(line.rstrip() == "---" for line in content.splitlines()[1:]):
+                self.validation_errors.append(f"{file_path}: Incomplete YAML frontmatter")
+                return False
+            
+            # Parse frontmatter
+            with self.phase("parse"):
+                frontmatter, body = self.parse_frontmatter(content)
+                
+                if not frontmatter:
+                    self.validation_errors.append(f"{file_path}: Could not parse frontmatter")
+                    return False
+            
+            # Validate required fields, field types and version consistency
+            with self.phase("schema"):
+                if not self.validate_schema(frontmatter, file_path):
+                    return False
+            
+            # Validate checksum
+            with self.phase("checksum"):
+                if not self.validate_checksum(frontmatter, content, file_path):
+                    return False
+            
+            # Validate dependencies
+            with self.phase("dependencies"):
+                if not self.validate_dependencies(frontmatter, file_path):
+                    return False
+            
+            return True
+            
+        except Exception as e:
+            self.validation_errors.append(f"{file_path}: Error reading file: {e}")
+            return False
+    
+    def history_dir(self, file_path: Path) -> str:
+        """Return a file's version history directory (entrypoint.md is special-cased)."""
+        return history_dir_for(file_path.resolve().relative_to(self.context_root))
+    
+    def validate_version_history(self, file_path: Path) -> bool:
+        """Validate that version history files exist and are consistent."""
+        try:
+            content = self.read_file(file_path)
+            frontmatter, _ = self.parse_frontmatter(content)
+            version = frontmatter.get("version", "")
+            
+            if not version:
+                return True  # Skip if no version
+            
+            history_dir = self.history_dir(file_path)
+            
+            # History entries may be loose files or compacted into the pack
+            if not self.history_has_version(history_dir, version):
+                history_file = self.history_store.loose_path(history_dir, version)
+                self.validation_warnings.append(
+                    f"{file_path}: Version history file not found: {history_file}"
+                )
+                return False
+            
+            return True
+            
+        except Exception as e:
+            self.validation_warnings.append(f"{file_path}: Error checking version history: {e}")
+            return False
+    
+    def context_files(self):
+        """Yield the context files validate_all_files checks."""
+        scan_dirs = [
+            self.context_root / "context",
+            self.context_root / "rules", 
+            self.context_root / "gemini"
+        ]
+        
+        for scan_dir in scan_dirs:
+            files = self.iter_markdown_files(scan_dir)
+            if files is not None:
+                for file_path in files:
+                    # Skip version history files, spec files, and virtual environment
+                    if ("versions" in file_path.parts or "spec" in file_path.parts or 
+                        "venv" in file_path.parts):
+                        continue
+                    yield file_path
+            
+            else:
+                print(f"Warning: Directory {scan_dir} does not exist")
+    
+    def validate_file(self, file_path: Path) -> bool:
+        """Validate one file's structure and, if that passes, its version history."""
+        print(f"Validating {file_path}...")
+        
+        result = {"path": file_path, "codes": set(), "bytes": 0, "digest": None}
+        errors = len(self.validation_errors)
+        self._current = result
+        start = time.perf_counter()
+        
+        try:
+            valid = self.validate_file_structure(file_path)
+            if valid:
+                # Also validate version history
+                with self.phase("history"):
+                    self.validate_version_history(file_path)
+        finally:
+            self._current = None
+            result["duration"] = time.perf_counter() - start
+            # Structural errors (empty file, missing frontmatter) fall outside the phases
+            if len(self.validation_errors) > errors and not any(
+                    code.endswith("-error") for code in result["codes"]):
+                result["codes"].add("structure-error")
+        
+        result["status"] = "valid" if valid else "invalid"
+        self.file_results.append(result)
+        
+        if not valid:
+            print(f"  ❌ Validation failed")
+        return valid
+    
+    def validate_all_files(self) -> bool:
+        """Validate all context files in the system."""
+        total_files = 0
+        valid_files = 0
+        
+        for file_path in self.context_files():
+            total_files += 1
+            if self.validate_file(file_path):
+                valid_files += 1
+        
+        return self.print_summary(total_files, valid_files)
+    
+    def print_summary(self, total_files: int, valid_files: int) -> bool:
+        """Print the validation summary and return True if there were no errors."""
+        print(f"\nValidation Summary:")
+        print(f"  Total files: {total_files}")
+        print(f"  Valid files: {valid_files}")
+        print(f"  Errors: {len(self.validation_errors)}")
+        print(f"  Warnings: {len(self.validation_warnings)}")
+        
+        if self.validation_errors:
+            print(f"\nValidation Errors:")
+            for error in self.validation_errors:
+                print(f"  ❌ {error}")
+        
+        if self.validation_warnings:
+            print(f"\nValidation Warnings:")
+            for warning in self.validation_warnings:
+                print(f"  ⚠️  {warning}")
+        
+        return len(self.validation_errors) == 0
+    
+    def validate_single_file(self, file_path: str) -> bool:
+        """Validate a single context file."""
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            print(f"Error: File {file_path} does not exist")
+            return False
+        
+        if not file_path.is_file():
+            print(f"Error: {file_path} is not a file")
+            return False
+        
+        print(f"Validating {file_path}...")
+        
+        if self.validate_file_structure(file_path):
+            print(f"  ✅ File structure validation passed")
+            
+            # Validate version history
+            print(f"  Checking version history...")
+            if self.validate_version_history(file_path):
+                print(f"  ✅ Version history validation passed")
+            else:
+                print(f"  ⚠️  Version history validation failed")
+            
+            return True
+        else:
+            print(f"  ❌ File structure validation failed")
+            return False
+
+    
+    def iter_documents(self):
+        """Yield (name, body) for every live file and history entry in the bank."""
+        scan_dirs = [
+            self.context_root / "context",
+            self.context_root / "rules", 
+            self.context_root / "gemini"
+        ]
+        
+        for scan_dir in scan_dirs:
+            if not scan_dir.exists():
+                continue
+            for file_path in sorted(scan_dir.rglob("*")):
+                if (file_path.suffix not in (".md", ".mdc") or not file_path.is_file()
+                        or "venv" in file_path.parts):
+                    continue
+                _, body = self.parse_frontmatter(self.read_file(file_path))
+                yield str(file_path.relative_to(self.context_root)), body
+        
+        # Loose history entries were covered by the scan above
+        rel_versions = self.versions_dir.relative_to(self.context_root)
+        for history_dir, entries in sorted(self.history_store.scan().items()):
+            for version, location in entries:
+                if location != "packed":
+                    continue
+                name = rel_versions / history_dir / f"{version}.md"
+                yield f"{name} (packed)", self.history_store.read_version(history_dir, version)
+    
+    def find_duplicates(self, threshold: float = 0.8) -> bool:
+        """Report exact and near-duplicate content across the bank."""
+        from .duplicates import DuplicateFinder
+        
+        cache_path = self.context_root / ".cache" / "minhash-signatures.bin"
+        finder = DuplicateFinder(cache_path, threshold=threshold)
+        
+        documents = 0
+        
+        def counted():
+            nonlocal documents
+            for document in self.iter_documents():
+                documents += 1
+                yield document
+        
+        clusters = finder.find(counted())
+        
+        print(f"Duplicate Summary:")
+        print(f"  Documents: {documents}")
+        print(f"  Newly hashed: {finder.hashed}")
+        print(f"  Exact duplicate groups: {len(clusters['exact'])}")
+        print(f"  Near-duplicate clusters (>= {threshold:.0%}): {len(clusters['near'])}")
+        
+        if clusters["exact"]:
+            print(f"\nExact Duplicates:")
+            for checksum, names in clusters["exact"]:
+                print(f"  {checksum}")
+                for name in names:
+                    print(f"    {name}")
+        
+        if clusters["near"]:
+            print(f"\nNear Duplicates:")
+            for number, cluster in enumerate(clusters["near"], 1):
+                print(f"  Cluster {number} ({len(cluster)} documents):")
+                for name, similarity in cluster:
+                    print(f"    {similarity:6.1%}  {name}")
+        
+        return True
+
+
+class RevisionValidator(ContextValidator):
+    """Validates context files at a git revision without checking it out.
+    
+    File contents come from git's object store through a RevisionTree, so the
+    working tree is never touched and every check, including dependency
+    existence and version history, runs against the revision's tree.
+    """
+    
+    def __init__(self, context_root: str, tree: "RevisionTree"):
+        super().__init__(context_root)
+        self.tree = tree
+        self._packed_keys: Optional[Set[str]] = None
+    
+    def read_file(self, path: Path) -> str:
+        return self.tree.read_text(path)
+    
+    def path_exists(self, path: Path) -> bool:
+        return self.tree.exists(path)
+    
+    def iter_markdown_files(self, scan_dir: Path):
+        if not self.tree.is_dir(scan_dir):
+            return None
+        return self.tree.rglob(scan_dir, ".md")
+    
+    def history_has_version(self, history_dir: str, version: str) -> bool:
+        if self.tree.exists(self.history_store.loose_path(history_dir, version)):
+            return True
+        
+        if self._packed_keys is None:
+            index_path = self.versions_dir / INDEX_NAME
+            if self.tree.exists(index_path):
+                self._packed_keys = set(parse_index(self.tree.read_text(index_path), index_path))
+            else:
+                self._packed_keys = set()
+        
+        return f"{history_dir}/{version}" in self._packed_keys
+
+
+def validate_revisions(context_root: str, revs: List[str]) -> bool:
+    """Validate each revision in turn, sharing one git cat-file process."""
+    from .git_objects import GitError, GitObjectStore, RevisionTree
+    
+    try:
+        store = GitObjectStore(Path(context_root))
+    except GitError as e:
+        print(f"Error: {e}")
+        return False
+    
+    all_valid = True
+    
+    with store:
+        for rev in revs:
+            try:
+                tree = RevisionTree(store, rev, Path(context_root))
+            except GitError as e:
+                print(f"Error: {e}")
+                all_valid = False
+                continue
+            
+            print(f"Validating revision {rev} ({tree.commit[:12]})...")
+            validator = RevisionValidator(context_root, tree)
+            if not validator.validate_all_files():
+                all_valid = False
+            print()
+    
+    return all_valid
+
@@ -0,0 +1,426 @@
+"""
+Context Version Control
+
+This module provides automated version bumping for context files in the memory-bank system.
+It handles semantic versioning, metadata updates, and version history management.
+
+Heavier dependencies (YAML, hashing, locking, the history store) are imported
+where they are used, so read-only commands such as `status` and `list` start
+without loading them.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .frontmatter_editor import FrontmatterError, read_header
+
+
+class BumpConflictError(Exception):
+    """Raised when a file's body no longer matches the expected checksum."""
+    
+    def __init__(self, file_path: Path, expected: str, actual: str):
+        super().__init__(
+            f"{file_path}: content changed underneath the bump\n"
+            f"  Expected: {expected}\n"
+            f"  Actual: {actual}"
+        )
+        self.file_path = file_path
+        self.expected = expected
+        self.actual = actual
+
+
+class ContextVersionManager:
+    """Manages version control for context files in the memory-bank system."""
+    
+    def __init__(self, context_root: str = "memory-bank"):
+        self.context_root = Path(context_root).resolve()
+        self.versions_dir = self.context_root / "context" / "versions"
+        self._history_store = None
+    
+    @property
+    def history_store(self):
+        """The version history store, created on first use."""
+        if self._history_store is None:
+            from .history_store import HistoryStore
+            self._history_store = HistoryStore(self.versions_dir)
+        return self._history_store
+        
+    def bump_version(self, current_version: str, bump_type: str) -> str:
+        """Bump version according to semantic versioning rules."""
+        if not re.match(r'^\d+\.\d+\.\d+', current_version):
+            raise ValueError(f"Invalid version format: {current_version}")
+        
+        major, minor, patch = map(int, current_version.split('.')[:3])
+        
+        if bump_type == "patch":
+            patch += 1
+        elif bump_type == "minor":
+            minor += 1
+            patch = 0
+        elif bump_type == "major":
+            major += 1
+            minor = 0
+            patch = 0
+        elif bump_type == "pre-release":
+            # Handle pre-release versions
+            if "-" in current_version:
+                pre_part = current_version.split("-", 1)[1]
+                if "." in pre_part:
+                    pre_type, pre_num = pre_part.split(".", 1)
+                    pre_num = int(pre_num) + 1
+                    return f"{major}.{minor}.{patch}-{pre_type}.{pre_num}"
+                else:
+                    return f"{major}.{minor}.{patch}-{pre_part}.1"
+            else:
+                return f"{major}.{minor}.{patch}-alpha.1"
+        else:
+            raise ValueError(f"Invalid bump type: {bump_type}")
+        
+        return f"{major}.{minor}.{patch}"
+    
+    def update_file_metadata(self, file_path: Path, bump_type: str, change_log: str,
+                             expected_checksum: Optional[str] = None) -> bool:
+        """Update file metadata with new version information.
+        
+        Callers must hold the file's lock. If expected_checksum is given and the
+        current body checksum differs, BumpConflictError is raised and the file
+        is left untouched.
+        """
+        from datetime import datetime
+        from .frontmatter_editor import FrontmatterDocument, FrontmatterError
+        
+        try:
+            content = file_path.read_text(encoding='utf-8')
+            try:
+                document = FrontmatterDocument.parse(content)
+            except FrontmatterError as e:
+                print(f"Warning: No frontmatter found in {file_path}: {e}")
+                return False
+            frontmatter = document.data
+            
+            if not frontmatter:
+                print(f"Warning: No frontmatter found in {file_path}")
+                return False
+            
+            # The body is never rewritten, so its checksum is computed once and
+            # serves both as the precondition and as the new stored checksum
+            current_checksum = document.body_checksum()
+            if expected_checksum and expected_checksum != current_checksum:
+                raise BumpConflictError(file_path, expected_checksum, current_checksum)
+            
+            # Get current version
+            current_version = str(frontmatter.get("version", "1.0.0"))
+            
+            # Bump version
+            new_version = self.bump_version(current_version, bump_type)
+            
+            # Patch only the changed metadata values in place
+            document.update({
+                "version": new_version,
+                "version_type": bump_type,
+                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                "change_log": change_log,
+                "checksum": current_checksum
+            })
+            final_content = document.render()
+            
+            # Write updated file atomically so readers never see a partial header
+            tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+            tmp_path.write_text(final_content, encoding='utf-8')
+            os.replace(tmp_path, file_path)
+            
+            print(f"Updated {file_path} to version {new_version}")
+            return True
+            
+        except BumpConflictError:
+            raise
+        except Exception as e:
+            print(f"Error updating {file_path}: {e}")
+            return False
+    
+    def create_version_history(self, file_path: Path, version: str, metadata: Dict) -> bool:
+        """Create version history entry."""
+        try:
+            # Create version history directory structure
+            version_dir = self.versions_dir / self.history_dir_for(file_path)
+            version_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Create version history file
+            history_file = version_dir / f"{version}.md"
+            
+            # Generate history content
+            history_content = self.generate_version_history_content(file_path, version, metadata)
+            history_file.write_text(history_content, encoding='utf-8')
+            
+            print(f"Created version history: {history_file}")
+            return True
+            
+        except Exception as e:
+            print(f"Error creating version history: {e}")
+            return False
+    
+    def history_dir_for(self, file_path: Path) -> str:
+        """Return the version history directory of a file, relative to versions/."""
+        from .history_store import history_dir_for
+        return history_dir_for(file_path.resolve().relative_to(self.context_root))
+    
+    def generate_version_history_content(self, file_path: Path, version: str, metadata: Dict) -> str:
+        """Generate content for version history file."""
+        rel_path = file_path.resolve().relative_to(self.context_root)
+        
+        content = f"""# {file_path.stem} - Version {version}
+
+**File**: `{rel_path}`  
+**Version**: {version}  
+**Date**: {metadata.get('last_updated', 'N/A')}  
+**Author**: {metadata.get('author', 'N/A')}  
+**Change Type**: {metadata.get('version_type', 'N/A')}  
+
+## Change Log
+{metadata.get('change_log', 'N/A')}
+
+## Content Summary
+This version includes the following changes and features:
+
+- Version metadata implementation
+- Automated version bumping
+- Change tracking and history
+
+## Dependencies
+{metadata.get('dependencies', [])}
+
+## Breaking Changes
+{metadata.get('breaking_changes', False)}
+
+## Migration Notes
+- This version introduces version control metadata
+- Existing files have been updated with version information
+
+## File Checksum
+{metadata.get('checksum', 'N/A')}
+
+---
+
+*This file is part of the version history for {rel_path}. It represents the state of the file at version {version}.*
+"""
+        return content
+    
+    def bump_file_version(self, file_path: str, bump_type: str, change_log: str,
+                          expected_checksum: Optional[str] = None, rebase: bool = False,
+                          retries: int = 3, lock_timeout: float = 10.0) -> bool:
+        """Main method to bump version of a context file.
+        
+        The metadata update and history entry are written under a per-file lock,
+        so concurrent bumps of the same file are serialised and bumps of
+        different files run in parallel. With expected_checksum the bump fails
+        if the body changed since the caller read it; with rebase it instead
+        retries on top of the new body, up to `retries` times.
+        """
+        from .file_lock import LockTimeoutError, file_lock
+        
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            print(f"Error: File {file_path} does not exist")
+            return False
+        
+        if not file_path.is_file():
+            print(f"Error: {file_path} is not a file")
+            return False
+        
+        for attempt in range(retries + 1):
+            try:
+                with file_lock(self.context_root, file_path, timeout=lock_timeout):
+                    # Update file metadata
+                    if not self.update_file_metadata(file_path, bump_type, change_log,
+                                                     expected_checksum):
+                        return False
+                    
+                    # Read updated metadata
+                    frontmatter = read_header(file_path)
+                    
+                    # Create version history
+                    if not self.create_version_history(file_path, frontmatter["version"], frontmatter):
+                        return False
+                
+                print(f"Successfully bumped {file_path} to version {frontmatter['version']}")
+                return True
+            
+            except LockTimeoutError as e:
+                print(f"Error: {e}")
+                return False
+            
+            except BumpConflictError as e:
+                if not rebase or attempt == retries:
+                    print(f"Conflict: {e}")
+                    return False
+                print(f"Conflict on {file_path}, rebasing onto {e.actual} "
+                      f"(attempt {attempt + 1} of {retries})")
+                expected_checksum = e.actual
+        
+        return False
+    
+    def show_file_history(self, file_path: str, version: Optional[str] = None) -> bool:
+        """Show version history of a file, or print one historical version."""
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            print(f"Error: File {file_path} does not exist")
+            return False
+        
+        try:
+            history_dir = self.history_dir_for(file_path)
+            if version:
+                content = self.history_store.read_version(history_dir, version)
+            else:
+                entries = self.history_store.list_versions(history_dir)
+        except (ValueError, OSError) as e:
+            # Files outside the context root have no history directory, and
+            # corrupt pack entries fail their digest check
+            print(f"Error: Could not read history of {file_path}: {e}")
+            return False
+        
+        if version:
+            if content is None:
+                print(f"Error: No history entry for {file_path} at version {version}")
+                return False
+            print(content)
+            return True
+        
+        if not entries:
+            print(f"{file_path}: No version history")
+            return False
+        
+        print(f"{file_path} history:")
+        for entry_version, location in entries:
+            print(f"  {entry_version} ({location})")
+        
+        return True
+    
+    def compact_history(self, keep: int, prune: bool = False, dry_run: bool = False,
+                        lock_timeout: float = 10.0) -> bool:
+        """Pack or prune history entries beyond the newest `keep` per file.
+        
+        Runs under a lock on the pack index, so concurrent compactions never
+        remove loose files or rewrite the pack underneath each other.
+        """
+        from .file_lock import LockTimeoutError, file_lock
+        from .history_store import INDEX_NAME
+        
+        try:
+            with file_lock(self.context_root, self.versions_dir / INDEX_NAME, timeout=lock_timeout):
+                return self._compact_history(keep, prune, dry_run)
+        except LockTimeoutError as e:
+            print(f"Error: {e}")
+            return False
+    
+    def _compact_history(self, keep: int, prune: bool, dry_run: bool) -> bool:
+        from .history_store import iter_live_files
+        
+        # Never prune the history entry of a live file's current version,
+        # including .mdc rules, which list_versioned_files does not cover
+        protect = set()
+        claimed = set()
+        for file_path in iter_live_files(self.context_root):
+            claimed.add(self.history_dir_for(file_path))
+            try:
+                frontmatter = read_header(file_path)
+            except (FrontmatterError, OSError) as e:
+                print(f"Warning: Could not read {file_path}: {e}")
+                continue
+            if frontmatter and frontmatter.get("version"):
+                protect.add(f"{self.history_dir_for(file_path)}/{frontmatter['version']}")
+        
+        # Current-version entries that exist now must still exist afterwards
+        present = {
+            key for key in protect
+            if self.history_store.has_version(*key.rsplit("/", 1))
+        }
+        
+        try:
+            stats = self.history_store.compact(keep, prune=prune, dry_run=dry_run,
+                                               protect=protect, claimed=claimed)
+        except Exception as e:
+            print(f"Error compacting version history: {e}")
+            return False
+        
+        lost = sorted(
+            key for key in present
+            if not self.history_store.has_version(*key.rsplit("/", 1))
+        )
+        if lost:
+            for key in lost:
+                print(f"Error: Compaction removed current-version history {key}")
+            return False
+        
+        prefix = "Would compact" if dry_run else "Compacted"
+        print(f"{prefix} version history in {self.versions_dir}:")
+        print(f"  Kept loose: {stats['kept']}")
+        print(f"  Packed: {stats['packed']}")
+        print(f"  Pruned: {stats['pruned']}")
+        if stats["unclaimed"]:
+            print(f"Warning: {stats['unclaimed']} entries beyond retention belong to history "
+                  f"directories with no live file and were not pruned (see history-check)")
+        return True
+    
+    def list_versioned_files(self) -> List[Path]:
+        """List all context files that have version metadata."""
+        versioned_files = []
+        
+        # Scan context, rules, and gemini directories
+        scan_dirs = [
+            self.context_root / "context",
+            self.context_root / "rules", 
+            self.context_root / "gemini"
+        ]
+        
+        for scan_dir in scan_dirs:
+            if scan_dir.exists():
+                for file_path in scan_dir.rglob("*.md"):
+                    if file_path.is_file():
+                        try:
+                            frontmatter = read_header(file_path)
+                            
+                            if frontmatter and "version" in frontmatter:
+                                versioned_files.append(file_path)
+                        except Exception as e:
+                            print(f"Warning: Could not read {file_path}: {e}")
+            else:
+                print(f"Warning: Directory {scan_dir} does not exist")
+        
+        return versioned_files
+    
+    def show_file_status(self, file_path: str) -> bool:
+        """Show version status of a specific file."""
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            print(f"Error: File {file_path} does not exist")
+            return False
+        
+        try:
+            frontmatter = read_header(file_path)
+        except FrontmatterError as e:
+            print(f"Error parsing frontmatter: {e}")
+            frontmatter = {}
+        
+        if not frontmatter or "version" not in frontmatter:
+            print(f"{file_path}: No version metadata")
+            return False
+        
+        print(f"{file_path}:")
+        print(f"  Version: {frontmatter.get('version', 'N/A')}")
+        print(f"  Type: {frontmatter.get('version_type', 'N/A')}")
+        print(f"  Last Updated: {frontmatter.get('last_updated', 'N/A')}")
+        print(f"  Change Log: {frontmatter.get('change_log', 'N/A')}")
+        print(f"  Author: {frontmatter.get('author', 'N/A')}")
+        print(f"  Breaking Changes: {frontmatter.get('breaking_changes', 'N/A')}")
+        
+        dependencies = frontmatter.get('dependencies', [])
+        if dependencies:
+            print(f"  Dependencies: {', '.join(dependencies)}")
+        
+        return True
+